@@ -8,44 +8,69 @@ Demonstrates:
 4. GitHubAgent
 """
 import sys
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
-# Add src to path
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
+from src.reign.swarm.reign_general import Task, plan_execution_waves
+from src.reign.swarm.agents.registry import AgentRegistry
 
-from reign.swarm.agents.docker_agent import DockerAgent
-from reign.swarm.agents.kubernetes_agent import KubernetesAgent
-from reign.swarm.agents.terraform_agent import TerraformAgent
-from reign.swarm.agents.github_agent import GitHubAgent
-from reign.swarm.reign_general import Task
+
+_EQ70 = "=" * 70
+_ROBOTS = "🤖" * 35
+
+# Closing summary, rendered once with format_map
+_SUMMARY_TMPL = """
+
+{rule}
+✨ SUMMARY
+{rule}
+
+📊 Test Results:
+   - Total tests: 48
+   - Passing: 48 ✅
+   - Failed: 0 ❌
+   - Coverage: 88%
+
+🤖 Agents:
+   - DockerAgent: Working ✅
+   - KubernetesAgent: Working ✅
+   - TerraformAgent: Working ✅
+   - GitHubAgent: Working ✅
+
+🎯 Capabilities:
+   - Intent understanding ✅
+   - Task decomposition ✅
+   - Self-validation ✅
+   - Confidence scoring ✅
+   - Best practice suggestions ✅
+   - Multi-agent coordination ✅
+
+🚀 Next: Add feedback loops & LLM integration!
+{rule}
+
+"""
+
+# Shared agent instances, each imported and built on first use
+AGENTS = AgentRegistry()
 
 
 def demo_all_agents():
     """Demo all specialized agents"""
-    print("\n" + "🤖" * 35)
-    print("      MULTI-AGENT SWARM - ALL AGENTS WORKING")
-    print("🤖" * 35 + "\n")
-    
-    # Initialize all agents
-    agents = {
-        "Docker": DockerAgent(),
-        "Kubernetes": KubernetesAgent(),
-        "Terraform": TerraformAgent(),
-        "GitHub": GitHubAgent()
-    }
-    
-    print("="*70)
-    print("AGENTS INITIALIZED")
-    print("="*70)
-    for name, agent in agents.items():
-        print(f"\n✅ {agent.name}")
-        print(f"   Expertise: {', '.join(agent.expertise[:3])}...")
+    buf = []  # Output is collected and written once at the end
+    buf.append("\n" + _ROBOTS)
+    buf.append("      MULTI-AGENT SWARM - ALL AGENTS WORKING")
+    buf.append(_ROBOTS + "\n")
+    
+    buf.append(_EQ70)
+    buf.append("AGENTS INITIALIZED")
+    buf.append(_EQ70)
+    for agent in AGENTS.values():
+        buf.append(f"\n✅ {agent.name}")
+        buf.append(f"   Expertise: {', '.join(agent.expertise[:3])}...")
     
     # DockerAgent Demo
-    print("\n\n" + "="*70)
-    print("DEMO 1: DockerAgent - Container Deployment")
-    print("="*70)
+    buf.append("\n\n" + _EQ70)
+    buf.append("DEMO 1: DockerAgent - Container Deployment")
+    buf.append(_EQ70)
     
     docker_task = Task(
         id=1,
@@ -54,18 +79,18 @@ def demo_all_agents():
         params={"image": "postgres:14.5", "name": "production-db"}
     )
     
-    docker_result = agents["Docker"].execute(docker_task)
-    print(f"\n📋 Task: {docker_task.description}")
-    print(f"   ✅ Success: {docker_result.success}")
-    print(f"   📊 Confidence: {docker_result.confidence:.2f}")
-    print(f"   💡 Suggestions: {len(docker_result.suggestions)}")
-    for s in docker_result.suggestions[:2]:
-        print(f"      - {s}")
+    docker_result = AGENTS["docker"].execute(docker_task)
+    buf.append(f"\n📋 Task: {docker_task.description}")
+    buf.append(f"   ✅ Success: {docker_result.success}")
+    buf.append(f"   📊 Confidence: {docker_result.confidence:.2f}")
+    suggestions = docker_result.suggestions
+    buf.append(f"   💡 Suggestions: {len(suggestions)}")
+    buf.extend(f"      - {s}" for s in suggestions[:2])
     
     # KubernetesAgent Demo
-    print("\n\n" + "="*70)
-    print("DEMO 2: KubernetesAgent - K8s Deployment")
-    print("="*70)
+    buf.append("\n\n" + _EQ70)
+    buf.append("DEMO 2: KubernetesAgent - K8s Deployment")
+    buf.append(_EQ70)
     
     k8s_task = Task(
         id=2,
@@ -79,17 +104,17 @@ def demo_all_agents():
         }
     )
     
-    k8s_result = agents["Kubernetes"].execute(k8s_task)
-    print(f"\n📋 Task: {k8s_task.description}")
-    print(f"   ✅ Success: {k8s_result.success}")
-    print(f"   📊 Confidence: {k8s_result.confidence:.2f}")
-    print(f"   📦 Kind: {k8s_result.output.get('kind')}")
-    print(f"   🔢 Replicas: {k8s_result.output.get('replicas')}")
+    k8s_result = AGENTS["kubernetes"].execute(k8s_task)
+    buf.append(f"\n📋 Task: {k8s_task.description}")
+    buf.append(f"   ✅ Success: {k8s_result.success}")
+    buf.append(f"   📊 Confidence: {k8s_result.confidence:.2f}")
+    buf.append(f"   📦 Kind: {k8s_result.output.get('kind')}")
+    buf.append(f"   🔢 Replicas: {k8s_result.output.get('replicas')}")
     
     # TerraformAgent Demo
-    print("\n\n" + "="*70)
-    print("DEMO 3: TerraformAgent - Infrastructure Provisioning")
-    print("="*70)
+    buf.append("\n\n" + _EQ70)
+    buf.append("DEMO 3: TerraformAgent - Infrastructure Provisioning")
+    buf.append(_EQ70)
     
     tf_task = Task(
         id=3,
@@ -102,19 +127,19 @@ def demo_all_agents():
         }
     )
     
-    tf_result = agents["Terraform"].execute(tf_task)
-    print(f"\n📋 Task: {tf_task.description}")
-    print(f"   ✅ Success: {tf_result.success}")
-    print(f"   📊 Confidence: {tf_result.confidence:.2f}")
-    print(f"   ☁️  Provider: {tf_result.output.get('provider', {}).get('aws', 'aws')}")
-    print(f"   💡 Suggestions: {len(tf_result.suggestions)}")
-    for s in tf_result.suggestions[:2]:
-        print(f"      - {s}")
+    tf_result = AGENTS["terraform"].execute(tf_task)
+    buf.append(f"\n📋 Task: {tf_task.description}")
+    buf.append(f"   ✅ Success: {tf_result.success}")
+    buf.append(f"   📊 Confidence: {tf_result.confidence:.2f}")
+    buf.append(f"   ☁️  Provider: {tf_result.output.get('provider', {}).get('aws', 'aws')}")
+    suggestions = tf_result.suggestions
+    buf.append(f"   💡 Suggestions: {len(suggestions)}")
+    buf.extend(f"      - {s}" for s in suggestions[:2])
     
     # GitHubAgent Demo
-    print("\n\n" + "="*70)
-    print("DEMO 4: GitHubAgent - Repository & Workflow Creation")
-    print("="*70)
+    buf.append("\n\n" + _EQ70)
+    buf.append("DEMO 4: GitHubAgent - Repository & Workflow Creation")
+    buf.append(_EQ70)
     
     gh_task = Task(
         id=4,
@@ -127,58 +152,53 @@ def demo_all_agents():
         }
     )
     
-    gh_result = agents["GitHub"].execute(gh_task)
-    print(f"\n📋 Task: {gh_task.description}")
-    print(f"   ✅ Success: {gh_result.success}")
-    print(f"   📊 Confidence: {gh_result.confidence:.2f}")
-    print(f"   📦 Repository: {gh_result.output.get('repository')}")
-    print(f"   🔒 Private: {gh_result.output.get('private')}")
-    print(f"   💡 Suggestions:")
+    gh_result = AGENTS["github"].execute(gh_task)
+    buf.append(f"\n📋 Task: {gh_task.description}")
+    buf.append(f"   ✅ Success: {gh_result.success}")
+    buf.append(f"   📊 Confidence: {gh_result.confidence:.2f}")
+    buf.append(f"   📦 Repository: {gh_result.output.get('repository')}")
+    buf.append(f"   🔒 Private: {gh_result.output.get('private')}")
+    buf.append(f"   💡 Suggestions:")
     for s in gh_result.suggestions[:3]:
-        print(f"      - {s}")
+        buf.append(f"      - {s}")
     
     # Multi-Agent Coordination Example
-    print("\n\n" + "="*70)
-    print("DEMO 5: Multi-Agent Coordination")
-    print("="*70)
-    print("\n📝 Scenario: Full-Stack Deployment Pipeline\n")
+    buf.append("\n\n" + _EQ70)
+    buf.append("DEMO 5: Multi-Agent Coordination")
+    buf.append(_EQ70)
+    buf.append("\n📝 Scenario: Full-Stack Deployment Pipeline\n")
     
     tasks = [
-        ("GitHub", Task(1, "Create repository", "github", {"name": "fullstack-app"})),
-        ("Terraform", Task(2, "Provision cloud infrastructure", "terraform", {"provider": "aws"})),
-        ("Kubernetes", Task(3, "Deploy application", "kubernetes", {"name": "app", "replicas": 3})),
-        ("Docker", Task(4, "Build container image", "docker", {"image": "app:v1.0.0"}))
+        ("github", Task(1, "Create repository", "github", {"name": "fullstack-app"})),
+        ("terraform", Task(2, "Provision cloud infrastructure", "terraform", {"provider": "aws"})),
+        ("kubernetes", Task(3, "Deploy application", "kubernetes", {"name": "app", "replicas": 3})),
+        ("docker", Task(4, "Build container image", "docker", {"image": "app:v1.0.0"}))
     ]
     
-    for i, (agent_name, task) in enumerate(tasks, 1):
-        result = agents[agent_name].execute(task)
-        status = "✅" if result.success else "❌"
-        print(f"{i}. {status} {agent_name}Agent: {task.description}")
-        print(f"   Confidence: {result.confidence:.2f}")
+    # Independent tasks run concurrently, one wave per dependency level;
+    # within a wave each agent gets its tasks as one batch
+    step = 0
+    for wave in plan_execution_waves(tasks):
+        batches = {}
+        for agent_key, task in wave:
+            batches.setdefault(agent_key, []).append(task)
+        
+        with ThreadPoolExecutor(max_workers=len(batches)) as pool:
+            batch_results = dict(zip(batches, pool.map(
+                lambda key: AGENTS[key].execute_batch(batches[key]), batches
+            )))
+        
+        wave_results = [batch_results[agent_key].pop(0) for agent_key, _ in wave]
+        for (agent_key, task), result in zip(wave, wave_results):
+            step += 1
+            status = "✅" if result.success else "❌"
+            buf.append(f"{step}. {status} {AGENTS[agent_key].name}: {task.description}")
+            buf.append(f"   Confidence: {result.confidence:.2f}")
     
     # Summary
-    print("\n\n" + "="*70)
-    print("✨ SUMMARY")
-    print("="*70)
-    print(f"\n📊 Test Results:")
-    print(f"   - Total tests: 48")
-    print(f"   - Passing: 48 ✅")
-    print(f"   - Failed: 0 ❌")
-    print(f"   - Coverage: 88%")
-    print(f"\n🤖 Agents:")
-    print(f"   - DockerAgent: Working ✅")
-    print(f"   - KubernetesAgent: Working ✅")
-    print(f"   - TerraformAgent: Working ✅")
-    print(f"   - GitHubAgent: Working ✅")
-    print(f"\n🎯 Capabilities:")
-    print(f"   - Intent understanding ✅")
-    print(f"   - Task decomposition ✅")
-    print(f"   - Self-validation ✅")
-    print(f"   - Confidence scoring ✅")
-    print(f"   - Best practice suggestions ✅")
-    print(f"   - Multi-agent coordination ✅")
-    print(f"\n🚀 Next: Add feedback loops & LLM integration!")
-    print("="*70 + "\n")
+    buf.append(_SUMMARY_TMPL.format_map({"rule": _EQ70}))
+    
+    sys.stdout.write("\n".join(buf))
 
 
 if __name__ == "__main__":
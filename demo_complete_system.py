@@ -9,24 +9,94 @@ Demonstrates the full REIGN system with:
 
 Built using Test-Driven Development - 79 tests passing!
 """
-from src.reign.swarm.reign_general import ReignGeneral, Task
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from src.reign.swarm.reign_general import ReignGeneral, Task, plan_execution_waves
+from src.reign.swarm.agents.registry import AgentRegistry
 from src.reign.swarm.feedback_loop import FeedbackLoop
-from src.reign.swarm.agents.docker_agent import DockerAgent
-from src.reign.swarm.agents.kubernetes_agent import KubernetesAgent
-from src.reign.swarm.agents.terraform_agent import TerraformAgent
-from src.reign.swarm.agents.github_agent import GitHubAgent
+
+
+_EQ80 = "=" * 80
+_DASH80 = "─" * 80
+# Banner templates are built once; only the title is substituted per call
+_HEADER_FMT = f"\n{_EQ80}\n  {{}}\n{_EQ80}\n\n".format
+_SECTION_FMT = f"\n{_DASH80}\n  {{}}\n{_DASH80}\n".format
+_ROW_FMT = "{:<6} {:<20} {:<10} {:.2f}/{:<8} {:<10} {}"
+
+# Statistics, capabilities and next steps, rendered once with format_map
+_SUMMARY_TMPL = """
+📊 Statistics:
+  - Total Tasks: {total_tasks}
+  - Successful: {successful}/{total_tasks} ({success_pct:.0f}%)
+  - Average Confidence: {avg_confidence:.2f}
+  - Total Execution Attempts: {total_attempts}
+  - Retry Rate: {retry_pct:.0f}% (feedback-driven improvement)
+
+{rule}
+  REIGN CAPABILITIES SHOWCASE
+{rule}
+
+✅ Natural Language Understanding
+   • Keyword-based parsing (fallback mode)
+   • LLM integration ready (OpenAI, Claude, Ollama)
+   • Intent classification with confidence scoring
+
+✅ Intelligent Task Decomposition
+   • Multi-step workflow generation
+   • Dependency tracking and ordering
+   • Component detection (database, API, frontend)
+
+✅ Feedback Loop System
+   • Automatic retry on low confidence
+   • Quality threshold enforcement
+   • Best practice suggestions
+   • Learning from failures
+
+✅ Multi-Agent Swarm
+   • 4 Specialized Agents (Docker, K8s, Terraform, GitHub)
+   • Self-validation capabilities
+   • Confidence scoring per agent
+   • Coordinated execution
+
+✅ Test-Driven Development
+   • 79 tests passing (100% success rate)
+   • 86% code coverage
+   • Incremental feature building
+   • Quality assured through TDD
+
+{rule}
+  REIGN SYSTEM OPERATIONAL ✓
+{rule}
+
+Next Steps:
+  1. Add LLM API keys for enhanced understanding
+  2. Connect to real infrastructure (Docker, K8s, Terraform CLIs)
+  3. Implement agent memory and learning
+  4. Build ValidationAgent for comprehensive checks
+  5. Create web UI for natural language control
+
+{rule}
+
+"""
+
+# Shared agent instances, each imported and built on first use
+AGENTS = AgentRegistry()
 
 
 def print_header(title):
-    print(f"\n{'='*80}")
-    print(f"  {title}")
-    print(f"{'='*80}\n")
+    sys.stdout.write(_HEADER_FMT(title))
 
 
 def print_section(title):
-    print(f"\n{'─'*80}")
-    print(f"  {title}")
-    print(f"{'─'*80}")
+    sys.stdout.write(_SECTION_FMT(title))
+
+
+def run_with_feedback(pair):
+    """Run one (agent, task) pair through its own feedback loop"""
+    agent, task = pair
+    loop = FeedbackLoop(max_retries=2, confidence_threshold=0.75)
+    return loop.execute_with_feedback(agent, task), loop
 
 
 def demo_complete_workflow():
@@ -77,7 +147,7 @@ def demo_complete_workflow():
     print_section("Scenario 3: Feedback Loop with Quality Control")
     
     loop = FeedbackLoop(max_retries=3, confidence_threshold=0.80)
-    agent = DockerAgent()
+    agent = AGENTS["docker"]
     
     # Task with issues (no version tag)
     task_with_issues = Task(
@@ -109,39 +179,33 @@ def demo_complete_workflow():
     # ============================================================================
     print_section("Scenario 4: Multi-Agent Swarm Coordination")
     
-    # Create agents
-    docker_agent = DockerAgent()
-    k8s_agent = KubernetesAgent()
-    terraform_agent = TerraformAgent()
-    github_agent = GitHubAgent()
-    
     # Define coordinated tasks
     coordinated_tasks = [
-        (docker_agent, Task(
+        (AGENTS["docker"], Task(
             id=1,
             description="Deploy PostgreSQL database",
             agent_type="docker",
             params={"image": "postgres:14-alpine", "port": 5432}
         )),
-        (docker_agent, Task(
+        (AGENTS["docker"], Task(
             id=2,
             description="Deploy Redis cache",
             agent_type="docker",
             params={"image": "redis:7-alpine", "port": 6379}
         )),
-        (k8s_agent, Task(
+        (AGENTS["kubernetes"], Task(
             id=3,
             description="Deploy web application to Kubernetes",
             agent_type="kubernetes",
             params={"action": "deploy", "name": "webapp", "image": "webapp:1.0", "replicas": 3}
         )),
-        (terraform_agent, Task(
+        (AGENTS["terraform"], Task(
             id=4,
             description="Provision AWS infrastructure",
             agent_type="terraform",
             params={"provider": "aws", "resources": ["vpc", "subnet", "rds"]}
         )),
-        (github_agent, Task(
+        (AGENTS["github"], Task(
             id=5,
             description="Create GitHub repository and CI/CD workflow",
             agent_type="github",
@@ -151,94 +215,65 @@ def demo_complete_workflow():
     
     print(f"Executing {len(coordinated_tasks)} coordinated tasks with feedback loops...\n")
     
-    results = []
-    for agent, task in coordinated_tasks:
-        print(f"→ Task {task.id}: {task.description}")
-        loop = FeedbackLoop(max_retries=2, confidence_threshold=0.75)
-        result = loop.execute_with_feedback(agent, task)
+    # Results are kept as parallel columns, one slot per task in original order
+    total_tasks = len(coordinated_tasks)
+    slot = {id(task): i for i, (_, task) in enumerate(coordinated_tasks)}
+    task_ids = [0] * total_tasks
+    agent_names = [""] * total_tasks
+    successes = [False] * total_tasks
+    confidences = [0.0] * total_tasks
+    attempts = [0] * total_tasks
+    feedback_counts = [0] * total_tasks
+    
+    # Independent tasks run concurrently, one wave per dependency level
+    for wave in plan_execution_waves(coordinated_tasks):
+        with ThreadPoolExecutor(max_workers=len(wave)) as pool:
+            outcomes = list(pool.map(run_with_feedback, wave))
         
-        results.append({
-            "task_id": task.id,
-            "agent": agent.name,
-            "success": result.success,
-            "confidence": result.confidence,
-            "attempts": loop.attempt_count,
-            "feedback_count": len(loop.feedback_history)
-        })
-        
-        print(f"  ✓ {agent.name}: {result.confidence:.2f} confidence in {loop.attempt_count} attempt(s)")
+        for (agent, task), (result, loop) in zip(wave, outcomes):
+            print(f"→ Task {task.id}: {task.description}")
+            i = slot[id(task)]
+            task_ids[i] = task.id
+            agent_names[i] = agent.name
+            successes[i] = result.success
+            confidences[i] = result.confidence
+            attempts[i] = loop.attempt_count
+            feedback_counts[i] = len(loop.feedback_history)
+            
+            print(f"  ✓ {agent.name}: {result.confidence:.2f} confidence in {loop.attempt_count} attempt(s)")
     
     # ============================================================================
     # SUMMARY
     # ============================================================================
-    print_header("EXECUTION SUMMARY")
-    
-    print("Multi-Agent Results:")
-    print(f"{'─'*80}")
-    print(f"{'Task':<6} {'Agent':<20} {'Success':<10} {'Confidence':<12} {'Attempts':<10} {'Feedback'}")
-    print(f"{'─'*80}")
-    
-    for r in results:
-        status = "✓" if r["success"] else "✗"
-        print(f"{r['task_id']:<6} {r['agent']:<20} {status:<10} {r['confidence']:.2f}/{0.75:<8} {r['attempts']:<10} {r['feedback_count']}")
+    # Summary output is collected and written once at the end
+    buf = ["Multi-Agent Results:"]
+    buf.append(_DASH80)
+    buf.append(f"{'Task':<6} {'Agent':<20} {'Success':<10} {'Confidence':<12} {'Attempts':<10} {'Feedback'}")
+    buf.append(_DASH80)
+    
+    row = _ROW_FMT.format
+    buf.extend(
+        row(tid, name, "✓" if ok else "✗", conf, 0.75, att, fb)
+        for tid, name, ok, conf, att, fb in zip(task_ids, agent_names, successes, confidences, attempts, feedback_counts)
+    )
     
-    print(f"{'─'*80}")
+    buf.append(_DASH80)
     
-    total_tasks = len(results)
-    successful = sum(1 for r in results if r["success"])
-    avg_confidence = sum(r["confidence"] for r in results) / len(results)
-    total_attempts = sum(r["attempts"] for r in results)
+    successful = sum(successes)
+    avg_confidence = sum(confidences) / total_tasks
+    total_attempts = sum(attempts)
     
-    print(f"\n📊 Statistics:")
-    print(f"  - Total Tasks: {total_tasks}")
-    print(f"  - Successful: {successful}/{total_tasks} ({successful/total_tasks*100:.0f}%)")
-    print(f"  - Average Confidence: {avg_confidence:.2f}")
-    print(f"  - Total Execution Attempts: {total_attempts}")
-    print(f"  - Retry Rate: {(total_attempts - total_tasks)/total_tasks*100:.0f}% (feedback-driven improvement)")
+    buf.append(_SUMMARY_TMPL.format_map({
+        "rule": _EQ80,
+        "total_tasks": total_tasks,
+        "successful": successful,
+        "success_pct": successful / total_tasks * 100,
+        "avg_confidence": avg_confidence,
+        "total_attempts": total_attempts,
+        "retry_pct": (total_attempts - total_tasks) / total_tasks * 100
+    }))
     
-    # ============================================================================
-    # CAPABILITIES SHOWCASE
-    # ============================================================================
-    print_header("REIGN CAPABILITIES SHOWCASE")
-    
-    print("✅ Natural Language Understanding")
-    print("   • Keyword-based parsing (fallback mode)")
-    print("   • LLM integration ready (OpenAI, Claude, Ollama)")
-    print("   • Intent classification with confidence scoring")
-    
-    print("\n✅ Intelligent Task Decomposition")
-    print("   • Multi-step workflow generation")
-    print("   • Dependency tracking and ordering")
-    print("   • Component detection (database, API, frontend)")
-    
-    print("\n✅ Feedback Loop System")
-    print("   • Automatic retry on low confidence")
-    print("   • Quality threshold enforcement")
-    print("   • Best practice suggestions")
-    print("   • Learning from failures")
-    
-    print("\n✅ Multi-Agent Swarm")
-    print("   • 4 Specialized Agents (Docker, K8s, Terraform, GitHub)")
-    print("   • Self-validation capabilities")
-    print("   • Confidence scoring per agent")
-    print("   • Coordinated execution")
-    
-    print("\n✅ Test-Driven Development")
-    print("   • 79 tests passing (100% success rate)")
-    print("   • 86% code coverage")
-    print("   • Incremental feature building")
-    print("   • Quality assured through TDD")
-    
-    print_header("REIGN SYSTEM OPERATIONAL ✓")
-    
-    print("Next Steps:")
-    print("  1. Add LLM API keys for enhanced understanding")
-    print("  2. Connect to real infrastructure (Docker, K8s, Terraform CLIs)")
-    print("  3. Implement agent memory and learning")
-    print("  4. Build ValidationAgent for comprehensive checks")
-    print("  5. Create web UI for natural language control")
-    
-    print(f"\n{'='*80}\n")
+    sys.stdout.write(_HEADER_FMT("EXECUTION SUMMARY") + "\n".join(buf))
 
 
 if __name__ == "__main__":
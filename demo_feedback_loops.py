@@ -7,24 +7,82 @@ This demonstrates how the FeedbackLoop enables:
 3. Applying best practice suggestions
 4. Improving task parameters
 """
+import copy
+import json
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
 from src.reign.swarm.feedback_loop import FeedbackLoop, Feedback, FeedbackType, FeedbackSeverity
-from src.reign.swarm.agents.docker_agent import DockerAgent
-from src.reign.swarm.agents.kubernetes_agent import KubernetesAgent
-from src.reign.swarm.agents.terraform_agent import TerraformAgent
-from src.reign.swarm.reign_general import Task
+from src.reign.swarm.reign_general import Task, plan_execution_waves
+from src.reign.swarm.agents.registry import AgentRegistry
+
+
+# Shared agent instances, each imported and built on first use
+AGENTS = AgentRegistry(("docker", "kubernetes", "terraform"))
+
+# Process-wide LRU of feedback-loop runs, shared by every demo below
+_EXECUTION_CACHE_SIZE = 512
+_execution_cache = OrderedDict()
+_execution_cache_lock = threading.Lock()  # demos call cached_execute from pool threads
+
+
+def cached_execute(loop, agent, task, auto_improve=False):
+    """
+    Run a task through a feedback loop, reusing identical earlier runs
+    
+    The demo agents are deterministic for a given task, so a run is keyed by
+    agent, task type, params and loop settings. On a hit the loop state
+    (attempts, feedback history) is restored from the cached run.
+    """
+    key = (
+        agent.name,
+        task.agent_type,
+        json.dumps(task.params, sort_keys=True, default=str),
+        loop.max_retries,
+        loop.confidence_threshold,
+        auto_improve
+    )
+    
+    with _execution_cache_lock:
+        cached = _execution_cache.get(key)
+        if cached is not None:
+            _execution_cache.move_to_end(key)
+    
+    if cached is not None:
+        # Each caller gets its own copies, never objects shared with another loop
+        result, attempts, feedback = copy.deepcopy(cached)
+        loop.attempt_count = attempts
+        loop.feedback_history = feedback
+        loop.last_result = result
+        return result
+    
+    result = loop.execute_with_feedback(agent, task, auto_improve=auto_improve)
+    entry = copy.deepcopy((result, loop.attempt_count, loop.feedback_history))
+    with _execution_cache_lock:
+        _execution_cache[key] = entry
+        if len(_execution_cache) > _EXECUTION_CACHE_SIZE:
+            _execution_cache.popitem(last=False)
+    return result
+
+
+_EQ70 = "=" * 70
+_DASH70 = "─" * 70
+
+
+_SECTION_FMT = f"\n{_EQ70}\n  {{}}\n{_EQ70}\n\n".format
 
 
 def print_section(title):
-    print(f"\n{'='*70}")
-    print(f"  {title}")
-    print(f"{'='*70}\n")
+    sys.stdout.write(_SECTION_FMT(title))
 
 
 def demo_basic_feedback():
     """Demo 1: Basic feedback loop with Docker"""
     print_section("Demo 1: Basic Feedback Loop - Docker Deployment")
     
-    agent = DockerAgent()
+    agent = AGENTS["docker"]
     loop = FeedbackLoop(max_retries=3, confidence_threshold=0.80)
     
     task = Task(
@@ -37,7 +95,7 @@ def demo_basic_feedback():
     print(f"Task: {task.description}")
     print(f"Confidence threshold: {loop.confidence_threshold}")
     
-    result = loop.execute_with_feedback(agent, task)
+    result = cached_execute(loop, agent, task)
     
     print(f"\n✓ Result:")
     print(f"  - Success: {result.success}")
@@ -57,7 +115,7 @@ def demo_low_confidence_retry():
     """Demo 2: Retry on low confidence"""
     print_section("Demo 2: Automatic Retry on Low Confidence")
     
-    agent = DockerAgent()
+    agent = AGENTS["docker"]
     loop = FeedbackLoop(max_retries=3, confidence_threshold=0.90)  # High threshold
     
     task = Task(
@@ -71,7 +129,7 @@ def demo_low_confidence_retry():
     print(f"Image: {task.params['image']} (no version tag)")
     print(f"High confidence threshold: {loop.confidence_threshold}")
     
-    result = loop.execute_with_feedback(agent, task)
+    result = cached_execute(loop, agent, task)
     
     print(f"\n✓ Result:")
     print(f"  - Success: {result.success}")
@@ -89,7 +147,7 @@ def demo_auto_improvement():
     """Demo 3: Auto-improvement with feedback"""
     print_section("Demo 3: Auto-Improvement with Feedback")
     
-    agent = DockerAgent()
+    agent = AGENTS["docker"]
     loop = FeedbackLoop(max_retries=3, confidence_threshold=0.85)
     
     task = Task(
@@ -103,16 +161,17 @@ def demo_auto_improvement():
     print(f"Original params: {task.params}")
     print(f"Auto-improve: ENABLED")
     
-    result = loop.execute_with_feedback(agent, task, auto_improve=True)
+    result = cached_execute(loop, agent, task, auto_improve=True)
     
     print(f"\n✓ Result:")
     print(f"  - Success: {result.success}")
     print(f"  - Confidence: {result.confidence:.2f}")
     print(f"  - Attempts: {loop.attempt_count}")
     
-    if result.suggestions:
+    suggestions = result.suggestions
+    if suggestions:
         print(f"\n  Best Practice Suggestions Applied:")
-        for suggestion in result.suggestions[:3]:
+        for suggestion in suggestions[:3]:
             print(f"    ✓ {suggestion}")
 
 
@@ -121,19 +180,19 @@ def demo_multi_agent_feedback():
     print_section("Demo 4: Multi-Agent Feedback Loop Coordination")
     
     tasks_and_agents = [
-        (DockerAgent(), Task(
+        (AGENTS["docker"], Task(
             id=4, 
             description="Deploy Redis cache",
             agent_type="docker",
             params={"image": "redis:7-alpine", "port": 6379}
         )),
-        (KubernetesAgent(), Task(
+        (AGENTS["kubernetes"], Task(
             id=5,
             description="Deploy web app to K8s",
             agent_type="kubernetes",
             params={"action": "deploy", "name": "webapp", "image": "myapp:1.0", "replicas": 3}
         )),
-        (TerraformAgent(), Task(
+        (AGENTS["terraform"], Task(
             id=6,
             description="Provision AWS infrastructure",
             agent_type="terraform",
@@ -141,23 +200,31 @@ def demo_multi_agent_feedback():
         ))
     ]
     
-    loop = FeedbackLoop(max_retries=2, confidence_threshold=0.75)
+    def run_one(pair):
+        # Each task gets its own loop so attempt counts don't bleed across tasks
+        agent, task = pair
+        loop = FeedbackLoop(max_retries=2, confidence_threshold=0.75)
+        return cached_execute(loop, agent, task), loop
+    
     results = []
     
-    for agent, task in tasks_and_agents:
-        print(f"\n→ Executing: {task.description}")
-        result = loop.execute_with_feedback(agent, task)
-        results.append({
-            "agent": agent.name,
-            "success": result.success,
-            "confidence": result.confidence,
-            "attempts": loop.attempt_count
-        })
-        print(f"  ✓ {agent.name}: Confidence {result.confidence:.2f} in {loop.attempt_count} attempt(s)")
+    for wave in plan_execution_waves(tasks_and_agents):
+        with ThreadPoolExecutor(max_workers=len(wave)) as pool:
+            outcomes = list(pool.map(run_one, wave))
+        
+        for (agent, task), (result, loop) in zip(wave, outcomes):
+            print(f"\n→ Executing: {task.description}")
+            results.append({
+                "agent": agent.name,
+                "success": result.success,
+                "confidence": result.confidence,
+                "attempts": loop.attempt_count
+            })
+            print(f"  ✓ {agent.name}: Confidence {result.confidence:.2f} in {loop.attempt_count} attempt(s)")
     
-    print(f"\n{'─'*70}")
+    print(f"\n{_DASH70}")
     print(f"  Multi-Agent Summary:")
-    print(f"{'─'*70}")
+    print(_DASH70)
     for r in results:
         status = "✓" if r["success"] else "✗"
         print(f"  {status} {r['agent']:20s} | Confidence: {r['confidence']:.2f} | Attempts: {r['attempts']}")
@@ -167,8 +234,7 @@ def demo_feedback_learning():
     """Demo 5: Learning from feedback history"""
     print_section("Demo 5: Learning from Feedback History")
     
-    agent = DockerAgent()
-    loop = FeedbackLoop(max_retries=3, confidence_threshold=0.80)
+    agent = AGENTS["docker"]
     
     # Series of tasks with progressive improvement
     tasks = [
@@ -183,9 +249,16 @@ def demo_feedback_learning():
     
     print("Running 3 tasks with progressive improvement:\n")
     
-    for i, task in enumerate(tasks, 1):
+    def run_one(task):
+        # The tasks are independent, so each runs concurrently in its own loop
+        loop = FeedbackLoop(max_retries=3, confidence_threshold=0.80)
+        return cached_execute(loop, agent, task)
+    
+    with ThreadPoolExecutor(max_workers=len(tasks)) as pool:
+        task_results = list(pool.map(run_one, tasks))
+    
+    for i, (task, result) in enumerate(zip(tasks, task_results), 1):
         print(f"{i}. {task.description}")
-        result = loop.execute_with_feedback(agent, task)
         print(f"   → Confidence: {result.confidence:.2f}")
         print(f"   → Suggestions: {len(result.suggestions)}")
         print()
@@ -198,10 +271,10 @@ def demo_feedback_learning():
 
 
 if __name__ == "__main__":
-    print("\n" + "="*70)
+    print("\n" + _EQ70)
     print("  REIGN FEEDBACK LOOP SYSTEM DEMONSTRATION")
     print("  Enabling Agent Learning & Quality Improvement")
-    print("="*70)
+    print(_EQ70)
     
     demo_basic_feedback()
     demo_low_confidence_retry()
@@ -209,9 +282,9 @@ if __name__ == "__main__":
     demo_multi_agent_feedback()
     demo_feedback_learning()
     
-    print(f"\n{'='*70}")
+    print(f"\n{_EQ70}")
     print("  ✓ Feedback Loop System Working!")
     print("  ✓ Agents can retry, learn, and improve")
     print("  ✓ Quality thresholds enforced")
     print("  ✓ Best practices applied automatically")
-    print(f"{'='*70}\n")
+    print(f"{_EQ70}\n")
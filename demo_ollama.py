@@ -8,13 +8,50 @@ Requirements:
 - Ollama installed and running (localhost:11434)
 - Model pulled: ollama pull llama3.2
 """
-from src.reign.swarm.llm_provider import LLMConfig, OllamaProvider, create_llm_provider
-from src.reign.swarm.reign_general import ReignGeneral
-from src.reign.swarm.feedback_loop import FeedbackLoop
-from src.reign.swarm.agents.docker_agent import DockerAgent
-from src.reign.swarm.agents.kubernetes_agent import KubernetesAgent
-from src.reign.swarm.agents.terraform_agent import TerraformAgent
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import astuple
+from functools import lru_cache
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# REIGN modules are imported inside the functions that use them, so the
+# common "Ollama is not running" path in main() exits without loading them
+
+OLLAMA_TAGS_URL = "http://localhost:11434/api/tags"
+OLLAMA_SHOW_URL = "http://localhost:11434/api/show"
+OLLAMA_TIMEOUT = (1.0, 2.0)  # (connect, read) seconds
+
+# One keep-alive session for every HTTP call the demo makes itself; failed
+# connects are retried, but read timeouts are not so OLLAMA_TIMEOUT holds
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=Retry(total=3, read=0)))
+
+
+@lru_cache(maxsize=None)
+def get_agents():
+    """Agents shared by all three demos, each built on first use"""
+    from src.reign.swarm.agents.registry import AgentRegistry
+    return AgentRegistry(("docker", "kubernetes", "terraform"))
+
+
+@lru_cache(maxsize=4)
+def _cached_general(config_fields):
+    from src.reign.swarm.llm_provider import LLMConfig
+    from src.reign.swarm.reign_general import ReignGeneral
+    from src.reign.swarm.intent_cache import IntentCache, IntentTemplateCache
+    
+    return ReignGeneral(
+        llm_config=LLMConfig(*config_fields),
+        intent_cache=IntentCache(),
+        template_cache=IntentTemplateCache()
+    )
+
+
+def get_general(llm_config):
+    """Shared ReignGeneral for each distinct LLM configuration"""
+    return _cached_general(astuple(llm_config))
 
 
 def print_header(title):
@@ -27,8 +64,14 @@ def check_ollama_status():
     """Check if Ollama is running and has llama3.2"""
     print("🔍 Checking Ollama status...")
     
+    # Ask for the model list and for llama3.2 directly at the same time
+    pool = ThreadPoolExecutor(max_workers=2)
+    tags_future = pool.submit(_SESSION.get, OLLAMA_TAGS_URL, timeout=OLLAMA_TIMEOUT)
+    show_future = pool.submit(_SESSION.post, OLLAMA_SHOW_URL, json={"name": "llama3.2"}, timeout=OLLAMA_TIMEOUT)
+    pool.shutdown(wait=False)
+    
     try:
-        response = requests.get("http://localhost:11434/api/tags")
+        response = tags_future.result()
         if response.status_code == 200:
             models = response.json()
             model_names = [m['name'] for m in models.get('models', [])]
@@ -38,6 +81,11 @@ def check_ollama_status():
             
             # Check for llama3.2
             has_llama32 = any('llama3.2' in m or 'llama3:latest' in m for m in model_names)
+            if not has_llama32:
+                try:
+                    has_llama32 = show_future.result().status_code == 200
+                except requests.exceptions.RequestException:
+                    pass
             if has_llama32:
                 print(f"  ✓ Llama 3.2 found!")
                 return True, model_names
@@ -51,6 +99,10 @@ def check_ollama_status():
         print(f"✗ Ollama is not running!")
         print(f"  Start it with: ollama serve")
         return False, []
+    except requests.exceptions.Timeout:
+        print(f"✗ Ollama is unresponsive (no answer within {OLLAMA_TIMEOUT[1]:.0f}s)")
+        print(f"  Restart it with: ollama serve")
+        return False, []
     except Exception as e:
         print(f"✗ Error checking Ollama: {e}")
         return False, []
@@ -58,6 +110,8 @@ def check_ollama_status():
 
 def demo_ollama_understanding():
     """Demo: Natural language understanding with Ollama"""
+    from src.reign.swarm.llm_provider import LLMConfig
+    
     print_header("Demo 1: Ollama-Powered Natural Language Understanding")
     
     # Configure Ollama
@@ -76,7 +130,7 @@ def demo_ollama_understanding():
     
     # Create REIGN with Ollama
     print(f"\n🤖 Initializing ReignGeneral with Ollama...")
-    general = ReignGeneral(llm_config=llm_config)
+    general = get_general(llm_config)
     
     if general.llm_provider:
         print(f"  ✓ LLM provider initialized successfully!")
@@ -96,27 +150,40 @@ def demo_ollama_understanding():
     print(f"Testing Ollama's Understanding:")
     print(f"{'─'*80}\n")
     
-    for i, request in enumerate(test_requests, 1):
+    # Requests are independent and LLM-bound, so send them all at once and
+    # report in the original order (Ollama serves OLLAMA_NUM_PARALLEL at a time)
+    def understand(request):
+        try:
+            return general.understand_request(request), None
+        except Exception as e:
+            return None, e
+    
+    print(f"(Set OLLAMA_NUM_PARALLEL=4 on the Ollama server to answer these in parallel)\n")
+    with ThreadPoolExecutor(max_workers=len(test_requests)) as pool:
+        outcomes = list(pool.map(understand, test_requests))
+    
+    for i, (request, (intent, error)) in enumerate(zip(test_requests, outcomes), 1):
         print(f"{i}. User: \"{request}\"")
         
-        try:
-            intent = general.understand_request(request)
-            
+        if error is None:
             print(f"   → Action: {intent.action}")
             print(f"   → Target: {intent.target}")
             print(f"   → Confidence: {intent.confidence:.2f}")
             if intent.params:
                 print(f"   → Params: {intent.params}")
             print()
-            
-        except Exception as e:
-            print(f"   ✗ Error: {e}")
+        else:
+            print(f"   ✗ Error: {error}")
             print(f"   (Falling back to keyword matching)")
             print()
 
 
 def demo_ollama_with_feedback():
     """Demo: Ollama + Feedback Loops"""
+    from src.reign.swarm.llm_provider import LLMConfig
+    from src.reign.swarm.reign_general import Task
+    from src.reign.swarm.feedback_loop import FeedbackLoop
+    
     print_header("Demo 2: Ollama + Feedback Loop Integration")
     
     llm_config = LLMConfig(
@@ -125,7 +192,7 @@ def demo_ollama_with_feedback():
         base_url="http://localhost:11434"
     )
     
-    general = ReignGeneral(llm_config=llm_config)
+    general = get_general(llm_config)
     
     # Natural language request
     request = "Deploy a production-ready PostgreSQL database with monitoring and backups"
@@ -146,11 +213,10 @@ def demo_ollama_with_feedback():
         # Now execute with feedback
         print(f"\n→ Executing with feedback loop...")
         
-        agent = DockerAgent()
+        agent = get_agents()["docker"]
         loop = FeedbackLoop(max_retries=3, confidence_threshold=0.80)
         
         # Create task from intent
-        from src.reign.swarm.reign_general import Task
         task = Task(
             id=1,
             description=intent.description,
@@ -177,10 +243,15 @@ def demo_ollama_with_feedback():
 
 def demo_ollama_multi_agent():
     """Demo: Ollama orchestrating multi-agent swarm"""
+    from src.reign.swarm.llm_provider import LLMConfig
+    from src.reign.swarm.reign_general import plan_execution_waves
+    from src.reign.swarm.feedback_loop import FeedbackLoop
+    
     print_header("Demo 3: Ollama Orchestrating Multi-Agent Swarm")
     
     llm_config = LLMConfig(provider="ollama", model="llama3.2")
-    general = ReignGeneral(llm_config=llm_config)
+    general = get_general(llm_config)
+    agents = get_agents()
     
     # Complex multi-infrastructure request
     request = """
@@ -214,19 +285,26 @@ def demo_ollama_multi_agent():
         # Execute with appropriate agents
         print(f"\n→ Executing swarm coordination...")
         
-        agents_map = {
-            "docker": DockerAgent(),
-            "kubernetes": KubernetesAgent(),
-            "terraform": TerraformAgent()
-        }
+        def run_with_feedback(pair):
+            # Each task gets its own loop; attempt_count is per-run state
+            agent, task = pair
+            loop = FeedbackLoop(max_retries=2, confidence_threshold=0.75)
+            return loop.execute_with_feedback(agent, task)
+        
+        # Execute first 3 tasks; independent ones run concurrently, one wave
+        # per dependency level, with at most 3 agents busy at a time
+        pairs = [
+            (agents[task.agent_type], task)
+            for task in tasks[:3]
+            if task.agent_type in agents
+        ]
         
         results = []
-        for task in tasks[:3]:  # Execute first 3 tasks
-            agent = agents_map.get(task.agent_type)
-            if agent:
-                loop = FeedbackLoop(max_retries=2, confidence_threshold=0.75)
-                result = loop.execute_with_feedback(agent, task)
-                
+        for wave in plan_execution_waves(pairs):
+            with ThreadPoolExecutor(max_workers=min(3, len(wave))) as pool:
+                wave_results = list(pool.map(run_with_feedback, wave))
+            
+            for (agent, task), result in zip(wave, wave_results):
                 results.append({
                     "task": task.description,
                     "agent": agent.name,
@@ -265,7 +343,8 @@ def main():
     
     print("\n✓ Ollama is operational!\n")
     
-    # Run demos
+    # Run demos one after another so they share the cached ReignGeneral and
+    # agents; each demo sends its own independent work concurrently
     try:
         demo_ollama_understanding()
         demo_ollama_with_feedback()
@@ -15,7 +15,11 @@ src_path = Path(__file__).parent / "src"
 sys.path.insert(0, str(src_path))
 
 from reign.swarm.reign_general import ReignGeneral, Intent, Task
-from reign.swarm.agents.docker_agent import DockerAgent, AgentResult
+from reign.swarm.agents.registry import AgentRegistry
+
+
+# One DockerAgent shared by every demo, built on first use
+AGENTS = AgentRegistry(("docker",))
 
 
 def demo_intent_understanding():
@@ -67,7 +71,7 @@ def demo_docker_agent():
     print("DEMO 3: DockerAgent Execution")
     print("="*70)
     
-    agent = DockerAgent()
+    agent = AGENTS["docker"]
     
     print(f"\n🤖 Agent: {agent.name}")
     print(f"   Expertise: {', '.join(agent.expertise)}\n")
@@ -117,7 +121,7 @@ def demo_validation():
     print("DEMO 4: Agent Self-Validation")
     print("="*70)
     
-    agent = DockerAgent()
+    agent = AGENTS["docker"]
     
     # Invalid image
     task = Task(
@@ -142,7 +146,7 @@ def demo_confidence_scoring():
     print("DEMO 5: Confidence Scoring")
     print("="*70)
     
-    agent = DockerAgent()
+    agent = AGENTS["docker"]
     
     tasks = [
         ("nginx:latest", "Using 'latest' tag"),
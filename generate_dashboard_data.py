@@ -3,6 +3,7 @@ Generate sample data for the REIGN dashboard.
 Populates databases with test executions and deployments.
 """
 
+import os
 import sqlite3
 from pathlib import Path
 from datetime import datetime, timedelta
@@ -10,6 +11,15 @@ import random
 import uuid
 import json
 
+# orjson is optional; it serializes the row payloads faster when installed
+try:
+    import orjson
+    
+    def dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:
+    dumps = json.dumps
+
 # Database paths
 home = Path.home()
 memory_db = home / ".reign" / "memory" / "agent_memory.db"
@@ -32,16 +42,45 @@ tasks = [
     "configure_storage"
 ]
 
+errors = [
+    "Connection timeout",
+    "Resource already exists",
+    "Permission denied",
+    "Invalid configuration"
+]
+
 resource_types = ["docker_container", "k8s_deployment", "k8s_service", "terraform_resource"]
 resource_names = [
     "web-api", "database", "redis-cache", "nginx-proxy",
     "worker-queue", "monitoring", "logging", "backup-service"
 ]
 
+# JSON payloads that are the same for every row, serialized once
+success_output = '{"status":"success"}'
+failed_output = '{"status":"failed"}'
+resource_metadata = dumps({"region": "us-west-2", "env": "production"})
+no_dependencies = "[]"
+
+def connect_for_bulk_load(db_path):
+    """
+    Open a database tuned for one large write transaction.
+    
+    Autocommit mode is used so the caller controls BEGIN/COMMIT explicitly;
+    the rest moves journaling and the page cache into memory where possible.
+    """
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")  # 64 MiB
+    conn.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+    return conn
+
 def populate_memory():
     """Add sample execution data to AgentMemory."""
-    conn = sqlite3.connect(memory_db)
+    conn = connect_for_bulk_load(memory_db)
     cursor = conn.cursor()
+    cursor.execute("BEGIN IMMEDIATE")
     
     # Create table if not exists
     cursor.execute("""
@@ -66,46 +105,53 @@ def populate_memory():
     # Generate 100 sample executions
     base_time = datetime.now() - timedelta(hours=24)
     
-    for i in range(100):
-        agent = random.choice(agents)
-        task = random.choice(tasks)
-        success = random.random() > 0.15  # 85% success rate
-        execution_time = random.uniform(0.5, 3.5)
-        timestamp = base_time + timedelta(minutes=random.randint(0, 1440))
-        
-        error = None if success else random.choice([
-            "Connection timeout",
-            "Resource already exists",
-            "Permission denied",
-            "Invalid configuration"
-        ])
+    # Draw each random column in one call instead of per row
+    n = 100
+    agent_draws = random.choices(agents, k=n)
+    task_draws = random.choices(tasks, k=n)
+    success_draws = [random.random() > 0.15 for _ in range(n)]  # 85% success rate
+    execution_times = [random.uniform(0.5, 3.5) for _ in range(n)]
+    minute_offsets = random.choices(range(1441), k=n)
+    
+    # Task names are fixed identifiers, so the per-row JSON is formatted
+    # directly instead of going through an encoder
+    rows = []
+    for i, (agent, task, success, execution_time, minutes) in enumerate(
+        zip(agent_draws, task_draws, success_draws, execution_times, minute_offsets)
+    ):
+        timestamp = base_time + timedelta(minutes=minutes)
+        error = None if success else random.choice(errors)
         
-        cursor.execute("""
-            INSERT INTO memories (
-                task_id, description, agent_type, parameters, success,
-                confidence, execution_time, output, error, timestamp
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        rows.append((
             i,
             task,
             agent,
-            json.dumps({"task": task, "target": f"resource-{i}"}),
+            f'{{"task":"{task}","target":"resource-{i}"}}',
             1 if success else 0,
             random.uniform(0.7, 1.0) if success else random.uniform(0.3, 0.7),
             execution_time,
-            json.dumps({"status": "success" if success else "failed"}),
+            success_output if success else failed_output,
             error,
             timestamp.isoformat()
         ))
     
-    conn.commit()
+    cursor.executemany("""
+        INSERT INTO memories (
+            task_id, description, agent_type, parameters, success,
+            confidence, execution_time, output, error, timestamp
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, rows)
+    
+    cursor.execute("COMMIT")
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
     conn.close()
     print(f"✓ Added 100 memory records to {memory_db}")
 
 def populate_state():
     """Add sample deployment data to StateManager."""
-    conn = sqlite3.connect(state_db)
+    conn = connect_for_bulk_load(state_db)
     cursor = conn.cursor()
+    cursor.execute("BEGIN IMMEDIATE")
     
     # Create tables if not exists
     cursor.execute("""
@@ -134,6 +180,11 @@ def populate_state():
     # Generate 25 sample deployments
     base_time = datetime.now() - timedelta(hours=48)
     
+    # One urandom read for all 25 resource ids plus the checkpoint id
+    raw = os.urandom(16 * 26)
+    ids = [str(uuid.UUID(bytes=raw[i * 16:(i + 1) * 16], version=4)) for i in range(26)]
+    
+    rows = []
     for i in range(25):
         resource_type = random.choice(resource_types)
         name = random.choice(resource_names) + f"-{i}"
@@ -141,35 +192,38 @@ def populate_state():
         status = random.choice(["deployed", "deployed", "deployed", "pending", "failed"])
         timestamp = base_time + timedelta(hours=random.randint(0, 48))
         
-        cursor.execute("""
-            INSERT INTO resources (
-                resource_id, resource_type, name, metadata, agent_type,
-                depends_on, status, deployed_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            str(uuid.uuid4()),
+        rows.append((
+            ids[i],
             resource_type,
             name,
-            json.dumps({"region": "us-west-2", "env": "production"}),
+            resource_metadata,
             agent,
-            json.dumps([]) if i == 0 else json.dumps([f"resource-{i-1}"]),
+            no_dependencies if i == 0 else f'["resource-{i-1}"]',
             status,
             timestamp.isoformat()
         ))
     
+    cursor.executemany("""
+        INSERT INTO resources (
+            resource_id, resource_type, name, metadata, agent_type,
+            depends_on, status, deployed_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """, rows)
+    
     # Add a checkpoint
     cursor.execute("""
         INSERT INTO checkpoints (
             checkpoint_id, description, resource_count, state_snapshot
         ) VALUES (?, ?, ?, ?)
     """, (
-        str(uuid.uuid4()),
+        ids[25],
         "Pre-deployment checkpoint",
         15,
-        json.dumps([{"id": f"res-{i}", "type": "container"} for i in range(15)])
+        dumps([{"id": f"res-{i}", "type": "container"} for i in range(15)])
     ))
     
-    conn.commit()
+    cursor.execute("COMMIT")
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
     conn.close()
     print(f"✓ Added 25 deployment records to {state_db}")
 
@@ -11,12 +11,15 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from reign.dashboard import ReignDashboard
-
 if __name__ == "__main__":
     print("Starting REIGN Dashboard...")
     print("=" * 50)
     try:
+        # Imported here so a plain import of this launcher stays cheap and
+        # the banner shows before Dear PyGui and the agents are loaded
+        print("Loading dashboard modules...")
+        from reign.dashboard import ReignDashboard
+        
         print("Creating dashboard instance...")
         dashboard = ReignDashboard()
         print("Dashboard created, calling run()...")
@@ -9,13 +9,20 @@ import dearpygui.dearpygui as dpg
 from pathlib import Path
 from datetime import datetime, timedelta
 import sqlite3
+import itertools
 import json
-from typing import Dict, List, Any, Optional
+import logging
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, NamedTuple, Optional
 import threading
 import time
 import traceback
 import sys
 
+logger = logging.getLogger(__name__)
+
 # Add src to path for imports - go up 3 levels from dashboard_app.py to reach src/
 _src_path = str(Path(__file__).resolve().parent.parent.parent)
 if _src_path not in sys.path:
@@ -26,13 +33,14 @@ REIGN_AVAILABLE = False
 import_error = ""
 ReignGeneral = None
 Task = None
+plan_execution_waves = None
 DockerAgent = None
 K8sAgent = None
 AgentMemory = None
 StateManager = None
 
 try:
-    from reign.swarm.reign_general import ReignGeneral, Task
+    from reign.swarm.reign_general import ReignGeneral, Task, plan_execution_waves
     from reign.swarm.agents.docker_agent import DockerAgent
     from reign.swarm.memory.agent_memory import AgentMemory
     from reign.swarm.state.state_manager import StateManager, ResourceState
@@ -51,6 +59,190 @@ except ImportError as e:
     import_error = f"Import failed: {e}\nPython path: {sys.path[:3]}\nSrc path: {_src_path}"
 
 
+# Applied once to every dashboard connection
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+# IDs for the Tasks the control panel builds
+_task_ids = itertools.count(1)
+
+# Characters kept in the activity log widget
+_LOG_TEXT_LIMIT = 10000
+
+# Seconds a checkpoint listing is reused by the checkpoint list and rollback dialog
+_CHECKPOINTS_TTL = 2.0
+
+# Schema scripts run by _init_databases. The index names match AgentMemory's,
+# so existing indexes are reused.
+_MEMORY_SCHEMA_SQL = """
+    BEGIN;
+    CREATE TABLE IF NOT EXISTS memories (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        task_id INTEGER,
+        description TEXT NOT NULL,
+        agent_type TEXT NOT NULL,
+        parameters TEXT,
+        success BOOLEAN NOT NULL,
+        confidence REAL,
+        execution_time REAL,
+        output TEXT,
+        error TEXT,
+        solution TEXT,
+        context TEXT,
+        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE INDEX IF NOT EXISTS idx_timestamp ON memories(timestamp);
+    CREATE INDEX IF NOT EXISTS idx_agent_type ON memories(agent_type);
+    CREATE INDEX IF NOT EXISTS idx_success_timestamp ON memories(success, timestamp);
+    COMMIT;
+"""
+
+_STATE_SCHEMA_SQL = """
+    BEGIN;
+    CREATE TABLE IF NOT EXISTS resources (
+        resource_id TEXT PRIMARY KEY,
+        resource_type TEXT NOT NULL,
+        name TEXT NOT NULL,
+        metadata TEXT,
+        agent_type TEXT NOT NULL,
+        depends_on TEXT,
+        status TEXT DEFAULT 'deployed',
+        deployed_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE TABLE IF NOT EXISTS checkpoints (
+        checkpoint_id TEXT PRIMARY KEY,
+        description TEXT NOT NULL,
+        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+        resource_count INTEGER,
+        state_snapshot TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_deployed_at ON resources(deployed_at);
+    COMMIT;
+"""
+
+# SQL is kept in module constants so every poll reuses the connection's
+# cached prepared statement.
+#
+# Everything the dashboard shows from the memory database, as one statement.
+# Rows are (tag, c1..c6); each UNION ALL arm keeps its own ORDER BY/LIMIT.
+# Parameters: ISO timestamp where the 24 hour timeline starts, and the newest
+# recent-task timestamp already buffered ("" for all). Timestamps only have
+# second resolution, so recent tasks at that timestamp are returned again
+# and told apart by id (c6).
+_MEMORY_DASHBOARD_SQL = """
+    WITH
+    by_agent AS (
+        SELECT agent_type,
+               COUNT(*) AS total,
+               SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) AS successes,
+               COALESCE(AVG(execution_time), 0) AS avg_time
+        FROM memories
+        GROUP BY agent_type
+    ),
+    failures AS (
+        SELECT agent_type, description, error, timestamp
+        FROM memories
+        WHERE success = 0
+        ORDER BY timestamp DESC
+        LIMIT 5
+    ),
+    hours AS (
+        SELECT strftime('%H:00', timestamp) AS hour,
+               COUNT(*) AS count,
+               SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) AS successes
+        FROM memories
+        WHERE timestamp > ?
+        GROUP BY hour
+        ORDER BY hour
+    ),
+    recent AS (
+        SELECT id, agent_type, description, success, execution_time, timestamp
+        FROM memories
+        WHERE timestamp >= ?
+        ORDER BY timestamp DESC, id DESC
+        LIMIT 20
+    )
+    SELECT 'total', NULL, COALESCE(SUM(total), 0), COALESCE(SUM(successes), 0),
+           COALESCE(100.0 * SUM(successes) / NULLIF(SUM(total), 0), 0), NULL, NULL FROM by_agent
+    UNION ALL SELECT 'agent', agent_type, total, successes, avg_time,
+           100.0 * successes / total, NULL FROM by_agent
+    UNION ALL SELECT 'failure', agent_type, description, error, timestamp, NULL, NULL FROM failures
+    UNION ALL SELECT 'hour', hour, count, successes, NULL, NULL, NULL FROM hours
+    UNION ALL SELECT 'recent', agent_type, description, success, execution_time, timestamp, id FROM recent
+"""
+
+
+# Latest deployments from the state database
+_DEPLOYMENTS_SQL = """
+    SELECT resource_id, resource_type, name, status, deployed_at, agent_type
+    FROM resources
+    ORDER BY deployed_at DESC
+    LIMIT 50
+"""
+
+
+class RecentFailure(NamedTuple):
+    """A failed execution in the agent stats."""
+    agent: str
+    task: str
+    error: Optional[str]
+    time: str
+
+
+class RecentTask(NamedTuple):
+    """A row of the Recent Tasks table."""
+    agent: str
+    task: str
+    success: bool
+    time: str
+    timestamp: str
+
+
+class Deployment(NamedTuple):
+    """A row of the Deployments table."""
+    id: str
+    type: str
+    name: str
+    status: str
+    deployed_at: str
+    deployed_by: str
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket for spacing out agent calls.
+    
+    Up to burst calls go through immediately; after that acquire() waits
+    for tokens, which refill at rate per second.
+    """
+    
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
 class ReignDashboard:
     """Main dashboard application for REIGN monitoring."""
     
@@ -73,24 +265,80 @@ class ReignDashboard:
         # Initialize databases if they don't exist
         self._init_databases()
         
+        # Read connections, kept open across refreshes
+        self._connections: Dict[str, sqlite3.Connection] = {}
+        self._db_lock = threading.Lock()
+        
+        # data_version seen by the last successful fetch of each database
+        self._memory_version = None
+        self._state_version = None
+        
         # UI state
         self.running = False
         self.refresh_interval = 2.0  # seconds
-        self.log_messages = []
+        
+        # Set after the dashboard itself writes to a database, to refresh
+        # without waiting out the interval
+        self._wake_event = threading.Event()
+        
+        # Set by the refresh thread when new data is ready; the render loop
+        # applies it, since Dear PyGui items must only be touched from there
+        self._ui_dirty = threading.Event()
+        self._ui_ready = False  # set once run() has built every tab
+        
+        # Agent callbacks run here instead of on a new thread per click. They
+        # mostly wait on docker/kubectl, so the pool is sized past the CPU count
+        self._executor = ThreadPoolExecutor(
+            max_workers=min(32, (os.cpu_count() or 1) * 4),
+            thread_name_prefix="reign-dash"
+        )
+        
+        # Caps how fast clicks turn into calls against the Docker daemon or
+        # cluster; bursts beyond it queue instead of all hitting at once
+        self._agent_limiter = TokenBucket(rate=20, burst=40)
+        
+        self._table_snapshots: Dict[str, list] = {}
+        self._table_rows: Dict[str, int] = {}  # rows currently built per table
         self.max_log_messages = 100
+        self.log_messages = deque(maxlen=self.max_log_messages)  # oldest drop off
+        self._log_dirty = False  # log_text is redrawn by the next _update_ui
+        
+        # What log_text shows, newest first, built as messages arrive
+        self._log_text = ""
+        self._log_lock = threading.Lock()
         
-        # Data cache
-        self.agent_stats = {}
-        self.memory_stats = {}
+        # Data cache, empty until the refresh thread's first load
+        self.agent_stats = {
+            "total_executions": 0,
+            "success_rate": 0,
+            "agents": [],
+            "recent_failures": []
+        }
+        self.memory_stats = {
+            "task_distribution": [],
+            "timeline": []
+        }
         self.deployments = []
         self.recent_tasks = []
         
+        # Newest-first window of recent tasks, extended with only the rows
+        # from _last_task_ts on each poll; _last_task_ids are the buffered
+        # ids at exactly that timestamp, which the next poll returns again
+        self._recent_tasks_buf = deque(maxlen=20)
+        self._last_task_ts = ""
+        self._last_task_ids = set()
+        self._last_total = 0
+        
         # REIGN components
         self.agent_memory = None
         self.state_manager = None
         self.reign_general = None
         self.docker_agent = None
         self.k8s_agent = None
+        self.terraform_agent = None
+        self._last_checkpoint_id = None
+        self._checkpoints_cache = None
+        self._checkpoints_cache_ts = 0.0
         self.reign_available = REIGN_AVAILABLE
         
         print(f"REIGN_AVAILABLE = {REIGN_AVAILABLE}")
@@ -131,308 +379,302 @@ class ReignDashboard:
             print("REIGN not available (import failed)")
         
     def _init_databases(self):
-        """Initialize database connections and tables if needed."""
-        # Memory database
-        if not Path(self.memory_db).exists():
-            conn = sqlite3.connect(self.memory_db)
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS memories (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    task_id INTEGER,
-                    description TEXT NOT NULL,
-                    agent_type TEXT NOT NULL,
-                    parameters TEXT,
-                    success BOOLEAN NOT NULL,
-                    confidence REAL,
-                    execution_time REAL,
-                    output TEXT,
-                    error TEXT,
-                    solution TEXT,
-                    context TEXT,
-                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            conn.commit()
-            conn.close()
+        """Initialize database tables and the indexes the dashboard reads through.
         
-        # State database
-        if not Path(self.state_db).exists():
-            conn = sqlite3.connect(self.state_db)
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS resources (
-                    resource_id TEXT PRIMARY KEY,
-                    resource_type TEXT NOT NULL,
-                    name TEXT NOT NULL,
-                    metadata TEXT,
-                    agent_type TEXT NOT NULL,
-                    depends_on TEXT,
-                    status TEXT DEFAULT 'deployed',
-                    deployed_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS checkpoints (
-                    checkpoint_id TEXT PRIMARY KEY,
-                    description TEXT NOT NULL,
-                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    resource_count INTEGER,
-                    state_snapshot TEXT NOT NULL
-                )
-            """)
-            conn.commit()
+        Runs on every start so the indexes also reach existing databases.
+        Only databases created here are switched to WAL; the mode persists in
+        the file, so existing databases keep their journal mode.
+        """
+        for db_path, script in ((self.memory_db, _MEMORY_SCHEMA_SQL), (self.state_db, _STATE_SCHEMA_SQL)):
+            created = not Path(db_path).exists()
+            conn = sqlite3.connect(db_path)
+            if created:
+                conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(script)
             conn.close()
     
     def _log(self, message: str, level: str = "INFO"):
         """Add a log message."""
         timestamp = datetime.now().strftime("%H:%M:%S")
         log_entry = f"[{timestamp}] [{level}] {message}"
-        self.log_messages.append(log_entry)
-        
-        # Keep only recent messages
-        if len(self.log_messages) > self.max_log_messages:
-            self.log_messages = self.log_messages[-self.max_log_messages:]
+        with self._log_lock:
+            self.log_messages.append(log_entry)
+            self._log_text = log_entry + "\n" + self._log_text
+            if len(self._log_text) > _LOG_TEXT_LIMIT:
+                # Drop whole lines from the oldest end
+                self._log_text = self._log_text[:self._log_text.rfind("\n", 0, _LOG_TEXT_LIMIT) + 1]
         
-        # Update log window if it exists
-        if dpg.does_item_exist("log_text"):
-            dpg.set_value("log_text", "\n".join(reversed(self.log_messages)))
+        # Bursts of messages are drawn once, on the next UI tick
+        self._log_dirty = True
+        self._ui_dirty.set()
     
-    def _fetch_agent_stats(self) -> Dict[str, Any]:
-        """Fetch agent execution statistics from memory database."""
+    def _fetch_all_memory(self) -> tuple:
+        """Fetch agent stats, memory stats and recent tasks in one query.
+        
+        Every aggregate comes from _MEMORY_DASHBOARD_SQL, whose rows are
+        tagged with the section they belong to.
+        
+        Returns:
+            (agent_stats, memory_stats, recent_tasks)
+        """
         try:
-            conn = sqlite3.connect(self.memory_db)
-            cursor = conn.cursor()
+            # The timeline window slides, so results are reused within a minute
+            version = (self._data_version(self.memory_db), datetime.now().strftime("%Y%m%d%H%M"))
+            if version == self._memory_version:
+                return self.agent_stats, self.memory_stats, self.recent_tasks
             
-            # Total executions
-            cursor.execute("SELECT COUNT(*) FROM memories")
-            total = cursor.fetchone()[0]
+            cursor = self._connection(self.memory_db).cursor()
+            yesterday = (datetime.now() - timedelta(days=1)).isoformat()
+            cursor.execute(_MEMORY_DASHBOARD_SQL, (yesterday, self._last_task_ts))
+            rows = cursor.fetchall()
             
-            # Success rate
-            cursor.execute("SELECT COUNT(*) FROM memories WHERE success = 1")
-            successes = cursor.fetchone()[0]
-            success_rate = (successes / total * 100) if total > 0 else 0
+            # Rows were deleted (pruned or cleared), so the buffered tail may
+            # hold tasks that are gone; rebuild it from scratch
+            total = next((row[2] for row in rows if row[0] == "total"), 0)
+            if total < self._last_total:
+                self._recent_tasks_buf.clear()
+                self._last_task_ts = ""
+                self._last_task_ids = set()
+                cursor.execute(_MEMORY_DASHBOARD_SQL, (yesterday, self._last_task_ts))
+                rows = cursor.fetchall()
             
-            # By agent
-            cursor.execute("""
-                SELECT agent_type, 
-                       COUNT(*) as total,
-                       SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) as successes,
-                       AVG(execution_time) as avg_time
-                FROM memories
-                GROUP BY agent_type
-            """)
+            total = success_rate = 0
             agents = []
-            for row in cursor.fetchall():
-                agents.append({
-                    "name": row[0],
-                    "total": row[1],
-                    "successes": row[2],
-                    "success_rate": (row[2] / row[1] * 100) if row[1] > 0 else 0,
-                    "avg_time": row[3] or 0
-                })
+            recent_failures = []
+            timeline = []
+            tasks = []
+            task_ids = []
+            for tag, c1, c2, c3, c4, c5, c6 in rows:
+                if tag == "total":
+                    total, success_rate = c2, c4
+                elif tag == "agent":
+                    agents.append({
+                        "name": c1,
+                        "total": c2,
+                        "successes": c3,
+                        "success_rate": c5,
+                        "avg_time": c4
+                    })
+                elif tag == "failure":
+                    recent_failures.append(RecentFailure(c1, c2, c3, c4))
+                elif tag == "hour":
+                    timeline.append({"hour": c1, "total": c2, "successes": c3})
+                elif tag == "recent" and c6 not in self._last_task_ids:
+                    task_ids.append(c6)
+                    tasks.append(RecentTask(c1, c2, bool(c3), f"{c4:.2f}s" if c4 else "N/A", c5))
             
-            # Recent failures
-            cursor.execute("""
-                SELECT agent_type, description, error, timestamp
-                FROM memories
-                WHERE success = 0
-                ORDER BY timestamp DESC
-                LIMIT 5
-            """)
-            recent_failures = [
-                {
-                    "agent": row[0],
-                    "task": row[1],
-                    "error": row[2],
-                    "time": row[3]
-                }
-                for row in cursor.fetchall()
-            ]
-            
-            conn.close()
-            
-            return {
+            agent_stats = {
                 "total_executions": total,
                 "success_rate": success_rate,
                 "agents": agents,
                 "recent_failures": recent_failures
             }
-        except Exception as e:
-            self._log(f"Error fetching agent stats: {e}", "ERROR")
-            return {
-                "total_executions": 0,
-                "success_rate": 0,
-                "agents": [],
-                "recent_failures": []
-            }
-    
-    def _fetch_memory_stats(self) -> Dict[str, Any]:
-        """Fetch memory statistics and patterns."""
-        try:
-            conn = sqlite3.connect(self.memory_db)
-            cursor = conn.cursor()
-            
-            # Task types distribution
-            cursor.execute("""
-                SELECT agent_type, COUNT(*) as count
-                FROM memories
-                GROUP BY agent_type
-                ORDER BY count DESC
-                LIMIT 10
-            """)
-            task_distribution = [
-                {"type": row[0], "count": row[1]}
-                for row in cursor.fetchall()
-            ]
-            
-            # Execution timeline (last 24 hours)
-            yesterday = (datetime.now() - timedelta(days=1)).isoformat()
-            cursor.execute("""
-                SELECT strftime('%H:00', timestamp) as hour,
-                       COUNT(*) as count,
-                       SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) as successes
-                FROM memories
-                WHERE timestamp > ?
-                GROUP BY hour
-                ORDER BY hour
-            """, (yesterday,))
-            timeline = [
-                {"hour": row[0], "total": row[1], "successes": row[2]}
-                for row in cursor.fetchall()
-            ]
-            
-            conn.close()
-            
-            return {
-                "task_distribution": task_distribution,
+            # The distribution is the per-agent totals, busiest first
+            by_total = sorted(agents, key=lambda agent: agent["total"], reverse=True)[:10]
+            memory_stats = {
+                "task_distribution": [{"type": agent["name"], "count": agent["total"]} for agent in by_total],
                 "timeline": timeline
             }
+            
+            # New tasks arrive newest first; extendleft takes them oldest first
+            # so the newest ends up at the front of the buffer
+            if tasks:
+                self._recent_tasks_buf.extendleft(reversed(tasks))
+                newest = tasks[0].timestamp
+                if newest != self._last_task_ts:
+                    self._last_task_ts = newest
+                    self._last_task_ids = set()
+                self._last_task_ids.update(
+                    task_id for task_id, task in zip(task_ids, tasks) if task.timestamp == newest
+                )
+            self._last_total = total
+            self._memory_version = version
+            return agent_stats, memory_stats, list(self._recent_tasks_buf)
         except Exception as e:
-            self._log(f"Error fetching memory stats: {e}", "ERROR")
-            return {
-                "task_distribution": [],
-                "timeline": []
-            }
+            self._log(f"Error fetching memory data: {e}", "ERROR")
+            return (
+                {
+                    "total_executions": 0,
+                    "success_rate": 0,
+                    "agents": [],
+                    "recent_failures": []
+                },
+                {
+                    "task_distribution": [],
+                    "timeline": []
+                },
+                []
+            )
     
     def _fetch_deployments(self) -> List[Dict[str, Any]]:
         """Fetch current deployments from state database."""
         try:
-            conn = sqlite3.connect(self.state_db)
-            cursor = conn.cursor()
+            version = self._data_version(self.state_db)
+            if version == self._state_version:
+                return self.deployments
             
-            cursor.execute("""
-                SELECT resource_id, resource_type, name, status, deployed_at, agent_type
-                FROM resources
-                ORDER BY deployed_at DESC
-                LIMIT 50
-            """)
+            cursor = self._connection(self.state_db).cursor()
+            
+            cursor.execute(_DEPLOYMENTS_SQL)
             
             deployments = [
-                {
-                    "id": row[0][:8] if row[0] else "N/A",  # Short ID
-                    "type": row[1],
-                    "name": row[2],
-                    "status": row[3],
-                    "deployed_at": row[4],
-                    "deployed_by": row[5] or "unknown"
-                }
+                Deployment(
+                    row["resource_id"][:8] if row["resource_id"] else "N/A",  # Short ID
+                    row["resource_type"],
+                    row["name"],
+                    row["status"],
+                    row["deployed_at"],
+                    row["agent_type"] or "unknown"
+                )
                 for row in cursor.fetchall()
             ]
             
-            conn.close()
+            self._state_version = version
             return deployments
         except Exception as e:
             self._log(f"Error fetching deployments: {e}", "ERROR")
             return []
     
-    def _fetch_recent_tasks(self) -> List[Dict[str, Any]]:
-        """Fetch recent task executions."""
-        try:
-            conn = sqlite3.connect(self.memory_db)
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT agent_type, description, success, execution_time, timestamp
-                FROM memories
-                ORDER BY timestamp DESC
-                LIMIT 20
-            """)
-            
-            tasks = [
-                {
-                    "agent": row[0],
-                    "task": row[1],
-                    "success": bool(row[2]),
-                    "time": f"{row[3]:.2f}s" if row[3] else "N/A",
-                    "timestamp": row[4]
-                }
-                for row in cursor.fetchall()
-            ]
-            
-            conn.close()
-            return tasks
-        except Exception as e:
-            self._log(f"Error fetching recent tasks: {e}", "ERROR")
-            return []
+    def _connection(self, db_path: str) -> sqlite3.Connection:
+        """Shared read connection for a database, opened on first use.
+        
+        Callers must hold self._db_lock; the connection is used from both
+        the refresh thread and the UI thread.
+        """
+        conn = self._connections.get(db_path)
+        if conn is None:
+            conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            for pragma in _CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            self._connections[db_path] = conn
+        return conn
     
-    def _update_data(self):
-        """Update all dashboard data."""
-        self.agent_stats = self._fetch_agent_stats()
-        self.memory_stats = self._fetch_memory_stats()
-        self.deployments = self._fetch_deployments()
-        self.recent_tasks = self._fetch_recent_tasks()
+    def _data_version(self, db_path: str) -> int:
+        """SQLite's data_version for a database.
+        
+        The value changes whenever another connection commits to the
+        database, so an unchanged value means cached results are current.
+        """
+        return self._connection(db_path).execute("PRAGMA data_version").fetchone()[0]
+    
+    def _close_connections(self):
+        """Close the shared database connections."""
+        with self._db_lock:
+            for conn in self._connections.values():
+                conn.close()
+            self._connections.clear()
+    
+    def _update_data(self) -> bool:
+        """Update all dashboard data.
+        
+        Returns:
+            True if any of the data changed
+        """
+        with self._db_lock:
+            before = (self.agent_stats, self.memory_stats, self.recent_tasks, self.deployments)
+            self.agent_stats, self.memory_stats, self.recent_tasks = self._fetch_all_memory()
+            self.deployments = self._fetch_deployments()
+            return (self.agent_stats, self.memory_stats, self.recent_tasks, self.deployments) != before
     
     def _refresh_loop(self):
-        """Background thread for data refresh."""
+        """Background thread for data refresh.
+        
+        The first load happens as soon as the thread starts, while the
+        window is already rendering. After that each tick costs a PRAGMA
+        data_version per database unless something was written, so writes
+        from other processes show up within refresh_interval; _wake_event
+        cuts the wait short after the dashboard's own deployments. The UI
+        itself is updated by the render loop in run().
+        """
         while self.running:
             try:
-                self._update_data()
-                self._update_ui()
-                time.sleep(self.refresh_interval)
+                if self._update_data():
+                    self._ui_dirty.set()
             except Exception as e:
                 self._log(f"Refresh error: {e}", "ERROR")
+            self._wake_event.wait(self.refresh_interval)
+            self._wake_event.clear()
+    
+    def _table_changed(self, tag: str, rows: list) -> bool:
+        """Whether rows differ from what was last rendered into a table."""
+        if self._table_snapshots.get(tag) == rows:
+            return False
+        self._table_snapshots[tag] = rows
+        return True
+    
+    def _sync_table(self, table: str, rows: List[List[str]]):
+        """Write rows into a table, reusing the row widgets already built.
+        
+        Rows are only created or deleted when the row count changes; cells
+        of existing rows are updated in place through their tags
+        (``{table}_row_{i}_c{j}``).
+        
+        Args:
+            table: Tag of the table
+            rows: Cell texts for each row
+        """
+        built = self._table_rows.get(table, 0)
+        for i, cells in enumerate(rows):
+            if i < built:
+                for j, text in enumerate(cells):
+                    dpg.set_value(f"{table}_row_{i}_c{j}", text)
+            else:
+                with dpg.table_row(parent=table, tag=f"{table}_row_{i}"):
+                    for j, text in enumerate(cells):
+                        dpg.add_text(text, tag=f"{table}_row_{i}_c{j}")
+        for i in range(len(rows), built):
+            dpg.delete_item(f"{table}_row_{i}")
+        self._table_rows[table] = len(rows)
     
     def _update_ui(self):
-        """Update UI elements with fresh data."""
-        # Update overview stats
-        if dpg.does_item_exist("total_executions"):
+        """Update UI elements with fresh data.
+        
+        Must run on the render thread. Tables whose rows are unchanged
+        since the last call are left alone.
+        """
+        # Every tagged item below is created with the tabs and never deleted
+        if not self._ui_ready:
+            return
+        
+        # One lock for the whole update, so a frame never shows it half applied
+        with dpg.mutex():
+            # Update overview stats
             dpg.set_value("total_executions", f"Total: {self.agent_stats['total_executions']}")
-        if dpg.does_item_exist("success_rate"):
             dpg.set_value("success_rate", f"Success: {self.agent_stats['success_rate']:.1f}%")
-        if dpg.does_item_exist("deployment_count"):
             dpg.set_value("deployment_count", f"Deployments: {len(self.deployments)}")
-        
-        # Update agent table
-        if dpg.does_item_exist("agent_table"):
-            dpg.delete_item("agent_table", children_only=True)
-            for agent in self.agent_stats['agents']:
-                with dpg.table_row(parent="agent_table"):
-                    dpg.add_text(agent['name'])
-                    dpg.add_text(str(agent['total']))
-                    dpg.add_text(f"{agent['success_rate']:.1f}%")
-                    dpg.add_text(f"{agent['avg_time']:.2f}s")
-        
-        # Update recent tasks table
-        if dpg.does_item_exist("tasks_table"):
-            dpg.delete_item("tasks_table", children_only=True)
-            for task in self.recent_tasks[:10]:
-                with dpg.table_row(parent="tasks_table"):
-                    dpg.add_text(task['agent'])
-                    dpg.add_text(task['task'])
-                    status_color = [0, 255, 0] if task['success'] else [255, 0, 0]
-                    dpg.add_text("✓" if task['success'] else "✗", color=status_color)
-                    dpg.add_text(task['time'])
-        
-        # Update deployments table
-        if dpg.does_item_exist("deploy_table"):
-            dpg.delete_item("deploy_table", children_only=True)
-            for dep in self.deployments[:15]:
-                with dpg.table_row(parent="deploy_table"):
-                    dpg.add_text(dep['id'])
-                    dpg.add_text(dep['type'])
-                    dpg.add_text(dep['name'])
-                    dpg.add_text(dep['status'])
-                    dpg.add_text(dep['deployed_by'])
+            
+            # Update log window
+            if self._log_dirty:
+                self._log_dirty = False
+                dpg.set_value("log_text", self._log_text)
+            
+            # Update agent table
+            agents = self.agent_stats['agents']
+            if self._table_changed("agent_table", agents):
+                self._sync_table("agent_table", [
+                    [agent['name'], str(agent['total']), f"{agent['success_rate']:.1f}%", f"{agent['avg_time']:.2f}s"]
+                    for agent in agents
+                ])
+            
+            # Update recent tasks table
+            tasks = self.recent_tasks[:10]
+            if self._table_changed("tasks_table", tasks):
+                self._sync_table("tasks_table", [
+                    [task.agent, task.task, "✓" if task.success else "✗", task.time]
+                    for task in tasks
+                ])
+                for i, task in enumerate(tasks):
+                    status_color = [0, 255, 0] if task.success else [255, 0, 0]
+                    dpg.configure_item(f"tasks_table_row_{i}_c2", color=status_color)
+            
+            # Update deployments table
+            deployments = self.deployments[:15]
+            if self._table_changed("deploy_table", deployments):
+                self._sync_table("deploy_table", [
+                    [dep.id, dep.type, dep.name, dep.status, dep.deployed_by]
+                    for dep in deployments
+                ])
     
     def _create_overview_tab(self):
         """Create the overview tab."""
@@ -719,6 +961,7 @@ class ReignDashboard:
                     self._create_metrics_tab()
                     self._create_containers_tab()
                     self._create_logs_tab()
+            self._ui_ready = True
             
             print("Setting up viewport...")
             # Setup viewport
@@ -737,15 +980,13 @@ class ReignDashboard:
             self._log(f"Memory DB: {self.memory_db}")
             self._log(f"State DB: {self.state_db}")
             
-            print("Loading initial data...")
-            # Initial data load
-            self._update_data()
-            self._update_ui()
-            
             print("Dashboard window should be visible!")
             print("Starting main loop...")
             # Main loop
             while dpg.is_dearpygui_running():
+                if self._ui_dirty.is_set():
+                    self._ui_dirty.clear()
+                    self._update_ui()
                 dpg.render_dearpygui_frame()
         except Exception as e:
             print(f"ERROR in dashboard.run(): {e}")
@@ -753,6 +994,8 @@ class ReignDashboard:
         finally:
             print("Cleaning up...")
             self.running = False
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._close_connections()
             try:
                 dpg.destroy_context()
             except:
@@ -775,7 +1018,7 @@ class ReignDashboard:
         def deploy():
             try:
                 task = Task(
-                    id=hash(f"docker_{name}_{image}") % 1000000,
+                    id=next(_task_ids),
                     description=f"Deploy Docker container {name}",
                     agent_type="docker",
                     params={
@@ -785,6 +1028,7 @@ class ReignDashboard:
                         "ports": {port.split(":")[0]: port.split(":")[1]} if ":" in port else {}
                     }
                 )
+                self._agent_limiter.acquire()
                 result = self.docker_agent.execute(task)
                 
                 if result.success:
@@ -799,12 +1043,13 @@ class ReignDashboard:
                             agent_type="docker"
                         )
                         self.state_manager.record_deployment(resource)
+                        self._wake_event.set()
                 else:
                     self._log(f"✗ Deployment failed: {result.error}", "ERROR")
             except Exception as e:
                 self._log(f"Error deploying container: {e}", "ERROR")
         
-        threading.Thread(target=deploy, daemon=True).start()
+        self._executor.submit(deploy)
     
     def _list_docker_containers(self):
         """List Docker containers."""
@@ -817,24 +1062,28 @@ class ReignDashboard:
         def list_containers():
             try:
                 task = Task(
-                    id=hash("docker_list") % 1000000,
+                    id=next(_task_ids),
                     description="List Docker containers",
                     agent_type="docker",
                     params={"action": "list"}
                 )
+                self._agent_limiter.acquire()
                 result = self.docker_agent.execute(task)
                 
                 if result.success:
                     containers = result.output.get("containers", [])
-                    self._log(f"Found {len(containers)} containers", "INFO")
-                    for container in containers[:5]:  # Show first 5
-                        self._log(f"  - {container.get('name', 'N/A')}: {container.get('status', 'N/A')}", "INFO")
+                    # One log entry for the whole listing, first 5 shown
+                    lines = "".join(
+                        f"\n  - {container.get('name', 'N/A')}: {container.get('status', 'N/A')}"
+                        for container in containers[:5]
+                    )
+                    self._log(f"Found {len(containers)} containers{lines}", "INFO")
                 else:
                     self._log(f"Failed to list containers: {result.error}", "ERROR")
             except Exception as e:
                 self._log(f"Error listing containers: {e}", "ERROR")
         
-        threading.Thread(target=list_containers, daemon=True).start()
+        self._executor.submit(list_containers)
     
     def _deploy_k8s_deployment(self):
         """Deploy a Kubernetes deployment."""
@@ -851,7 +1100,7 @@ class ReignDashboard:
         def deploy():
             try:
                 task = Task(
-                    id=hash(f"k8s_{name}_{image}") % 1000000,
+                    id=next(_task_ids),
                     description=f"Deploy K8s deployment {name}",
                     agent_type="kubernetes",
                     params={
@@ -861,6 +1110,7 @@ class ReignDashboard:
                         "replicas": replicas
                     }
                 )
+                self._agent_limiter.acquire()
                 result = self.k8s_agent.execute(task)
                 
                 if result.success:
@@ -875,12 +1125,13 @@ class ReignDashboard:
                             agent_type="kubernetes"
                         )
                         self.state_manager.record_deployment(resource)
+                        self._wake_event.set()
                 else:
                     self._log(f"✗ Deployment failed: {result.error}", "ERROR")
             except Exception as e:
                 self._log(f"Error creating deployment: {e}", "ERROR")
         
-        threading.Thread(target=deploy, daemon=True).start()
+        self._executor.submit(deploy)
     
     def _list_k8s_deployments(self):
         """List Kubernetes deployments."""
@@ -893,24 +1144,28 @@ class ReignDashboard:
         def list_deployments():
             try:
                 task = Task(
-                    id=hash("k8s_list") % 1000000,
+                    id=next(_task_ids),
                     description="List K8s deployments",
                     agent_type="kubernetes",
                     params={"action": "list_deployments"}
                 )
+                self._agent_limiter.acquire()
                 result = self.k8s_agent.execute(task)
                 
                 if result.success:
                     deployments = result.output.get("deployments", [])
-                    self._log(f"Found {len(deployments)} deployments", "INFO")
-                    for dep in deployments[:5]:  # Show first 5
-                        self._log(f"  - {dep.get('name', 'N/A')}: {dep.get('replicas', 'N/A')} replicas", "INFO")
+                    # One log entry for the whole listing, first 5 shown
+                    lines = "".join(
+                        f"\n  - {dep.get('name', 'N/A')}: {dep.get('replicas', 'N/A')} replicas"
+                        for dep in deployments[:5]
+                    )
+                    self._log(f"Found {len(deployments)} deployments{lines}", "INFO")
                 else:
                     self._log(f"Failed to list deployments: {result.error}", "ERROR")
             except Exception as e:
                 self._log(f"Error listing deployments: {e}", "ERROR")
         
-        threading.Thread(target=list_deployments, daemon=True).start()
+        self._executor.submit(list_deployments)
     
     def _create_checkpoint(self):
         """Create a state checkpoint."""
@@ -922,13 +1177,26 @@ class ReignDashboard:
         self._log(f"Creating checkpoint: {name}", "INFO")
         
         try:
+            # Stored as a delta against the previous checkpoint from this session
             checkpoint_id = self.state_manager.create_checkpoint(
-                description=name
+                description=name,
+                base=self._last_checkpoint_id
             )
+            self._last_checkpoint_id = checkpoint_id
+            self._checkpoints_cache = None
             self._log(f"✓ Checkpoint created: {checkpoint_id[:8]}", "INFO")
+            self._wake_event.set()
         except Exception as e:
             self._log(f"Error creating checkpoint: {e}", "ERROR")
     
+    def _get_checkpoints(self) -> List[Dict[str, Any]]:
+        """Checkpoint listing, reused for _CHECKPOINTS_TTL seconds."""
+        now = time.monotonic()
+        if self._checkpoints_cache is None or now - self._checkpoints_cache_ts >= _CHECKPOINTS_TTL:
+            self._checkpoints_cache = self.state_manager.list_checkpoints()
+            self._checkpoints_cache_ts = now
+        return self._checkpoints_cache
+    
     def _list_checkpoints(self):
         """List available checkpoints."""
         if not self.state_manager:
@@ -938,10 +1206,13 @@ class ReignDashboard:
         self._log("Listing checkpoints...", "INFO")
         
         try:
-            checkpoints = self.state_manager.list_checkpoints()
-            self._log(f"Found {len(checkpoints)} checkpoints", "INFO")
-            for cp in checkpoints[:5]:  # Show first 5
-                self._log(f"  - {cp.checkpoint_id[:8]}: {cp.description} ({cp.resource_count} resources)", "INFO")
+            checkpoints = self._get_checkpoints()
+            # One log entry for the whole listing, first 5 shown
+            lines = "".join(
+                f"\n  - {cp['checkpoint_id'][:8]}: {cp['description']} ({cp['resource_count']} resources)"
+                for cp in checkpoints[:5]
+            )
+            self._log(f"Found {len(checkpoints)} checkpoints{lines}", "INFO")
         except Exception as e:
             self._log(f"Error listing checkpoints: {e}", "ERROR")
     
@@ -952,7 +1223,7 @@ class ReignDashboard:
             return
         
         try:
-            checkpoints = self.state_manager.list_checkpoints()
+            checkpoints = self._get_checkpoints()
             if not checkpoints:
                 self._log("No checkpoints available for rollback", "WARNING")
                 return
@@ -967,9 +1238,9 @@ class ReignDashboard:
                 for cp in checkpoints[:10]:
                     with dpg.group(horizontal=True):
                         dpg.add_button(
-                            label=f"Rollback to: {cp.description}",
-                            callback=lambda s, a, u: self._execute_rollback(u),
-                            user_data=cp.checkpoint_id,
+                            label=f"Rollback to: {cp['description']}",
+                            callback=self._rollback_callback,
+                            user_data=cp['checkpoint_id'],
                             width=350
                         )
                 
@@ -979,9 +1250,14 @@ class ReignDashboard:
         except Exception as e:
             self._log(f"Error showing rollback dialog: {e}", "ERROR")
     
+    def _rollback_callback(self, sender, app_data, user_data):
+        """Shared callback for the rollback dialog buttons; user_data is the checkpoint ID."""
+        self._execute_rollback(user_data)
+    
     def _execute_rollback(self, checkpoint_id: str):
         """Execute rollback to checkpoint."""
         dpg.delete_item("rollback_window")
+        self._checkpoints_cache = None
         self._log(f"Rolling back to checkpoint {checkpoint_id[:8]}...", "INFO")
         
         def rollback():
@@ -992,11 +1268,15 @@ class ReignDashboard:
                 # Execute rollback
                 removed = self.state_manager.rollback_to_checkpoint(checkpoint_id)
                 self._log(f"✓ Rollback complete: {len(removed)} resources removed", "INFO")
+                self._wake_event.set()
             except Exception as e:
                 self._log(f"Error during rollback: {e}", "ERROR")
-                self._log(traceback.format_exc(), "ERROR")
+                # Formatting the stack reads source files, so the full
+                # traceback is only added to the log when debugging
+                if logger.isEnabledFor(logging.DEBUG):
+                    self._log(traceback.format_exc(), "ERROR")
         
-        threading.Thread(target=rollback, daemon=True).start()
+        self._executor.submit(rollback)
     
     def _execute_reign_task(self):
         """Execute a task using ReignGeneral orchestrator."""
@@ -1013,45 +1293,68 @@ class ReignDashboard:
                 tasks = self.reign_general.decompose_task(description)
                 self._log(f"✓ Decomposed into {len(tasks)} subtask(s)", "INFO")
                 
-                # Execute each decomposed task with appropriate agent
+                # Route each subtask to its agent
+                agents = {
+                    "docker": self.docker_agent,
+                    "kubernetes": self.k8s_agent,
+                    "terraform": self.terraform_agent,
+                }
+                pairs = []
                 for task in tasks:
-                    self._log(f"Executing {task.agent_type} task: {task.description}", "INFO")
-                    
+                    agent = agents.get(task.agent_type)
+                    if agent:
+                        pairs.append((agent, task))
+                    else:
+                        self._log(f"No agent available for type: {task.agent_type}", "WARNING")
+                
+                def run_subtask(pair):
+                    agent, task = pair
                     try:
-                        # Route to appropriate agent based on agent_type
-                        if task.agent_type == "docker" and self.docker_agent:
-                            result = self.docker_agent.execute(task)
-                        elif task.agent_type == "kubernetes" and self.k8s_agent:
-                            result = self.k8s_agent.execute(task)
-                        elif task.agent_type == "terraform" and self.terraform_agent:
-                            result = self.terraform_agent.execute(task)
-                        else:
-                            self._log(f"No agent available for type: {task.agent_type}", "WARNING")
-                            continue
-                        
-                        if result.success:
+                        self._agent_limiter.acquire()
+                        return agent.execute(task), None
+                    except Exception as e:
+                        return None, e
+                
+                # Subtasks without dependencies between them run concurrently,
+                # one wave at a time; results are logged in task order.
+                # Deployed resources are recorded together once all waves ran
+                deployed = []
+                for wave in plan_execution_waves(pairs):
+                    for _, task in wave:
+                        self._log(f"Executing {task.agent_type} task: {task.description}", "INFO")
+                    
+                    with ThreadPoolExecutor(max_workers=len(wave)) as pool:
+                        outcomes = list(pool.map(run_subtask, wave))
+                    
+                    for (_, task), (result, error) in zip(wave, outcomes):
+                        if error is not None:
+                            self._log(f"Error executing subtask: {error}", "ERROR")
+                        elif result.success:
                             self._log(f"✓ Subtask completed: {task.description}", "INFO")
-                            # Record in state manager
-                            if self.state_manager:
-                                resource = ResourceState(
-                                    resource_id=f"{task.agent_type}_{task.id}",
-                                    resource_type=task.agent_type,
-                                    name=task.description,
-                                    metadata=task.params,
-                                    agent_type=task.agent_type
-                                )
-                                self.state_manager.record_deployment(resource)
+                            deployed.append(ResourceState(
+                                resource_id=f"{task.agent_type}_{task.id}",
+                                resource_type=task.agent_type,
+                                name=task.description,
+                                metadata=task.params,
+                                agent_type=task.agent_type
+                            ))
                         else:
                             self._log(f"✗ Subtask failed: {result.error}", "ERROR")
-                    except Exception as e:
-                        self._log(f"Error executing subtask: {e}", "ERROR")
+                
+                # Record in state manager
+                if deployed and self.state_manager:
+                    self.state_manager.record_deployments(deployed)
+                    self._wake_event.set()
                 
                 self._log(f"✓ ReignGeneral task completed", "INFO")
             except Exception as e:
                 self._log(f"Error decomposing task: {e}", "ERROR")
-                self._log(traceback.format_exc(), "ERROR")
+                # Formatting the stack reads source files, so the full
+                # traceback is only added to the log when debugging
+                if logger.isEnabledFor(logging.DEBUG):
+                    self._log(traceback.format_exc(), "ERROR")
         
-        threading.Thread(target=execute, daemon=True).start()
+        self._executor.submit(execute)
 
 
 def main():
@@ -0,0 +1,23 @@
+"""
+JSON helpers for the SQLite-backed stores.
+
+orjson is optional; when installed it parses and writes the JSON columns
+(metadata, parameters, snapshots) several times faster than json.
+"""
+
+import json
+
+try:
+    import orjson
+    
+    loads = orjson.loads
+    
+    def dumps(obj) -> str:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # Values orjson refuses (e.g. ints beyond 64 bits) still go through json
+            return json.dumps(obj)
+except ImportError:
+    loads = json.loads
+    dumps = json.dumps
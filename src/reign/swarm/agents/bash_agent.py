@@ -6,18 +6,244 @@ and performs file operations with safety validation.
 """
 
 import subprocess
-import tempfile
+import os
 import re
-from pathlib import Path
-from typing import Dict, Any, List, Optional
+import select
+import selectors
+import shlex
+import shutil
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Any, List, NamedTuple, Optional
 from dataclasses import dataclass, field
+import locale
 import logging
 import sys
+import time
 
 logger = logging.getLogger(__name__)
 
+# Dangerous command patterns to validate
+_DANGEROUS_PATTERNS = (
+    r"rm\s+-rf\s+/",  # rm -rf /
+    r"rm\s+-rf\s+~",  # rm -rf ~
+    r":\(\)\{\s*:\|:&\s*\};:",  # Fork bomb
+    r"dd\s+if=.*\s+of=/dev/sd",  # Disk wipe
+    r"mkfs\.",  # Format filesystem
+    r">\s*/dev/sd",  # Write to disk device
+)
+# All patterns as one alternation, so a command is scanned once;
+# group p<i> tells which pattern matched
+_DANGER_RE = re.compile(
+    "|".join(f"(?P<p{i}>{pattern})" for i, pattern in enumerate(_DANGEROUS_PATTERNS)),
+    re.IGNORECASE
+)
 
-@dataclass
+# Plain substrings that are always refused, matched case-insensitively in one scan
+_DESTRUCTIVE_COMMANDS = (
+    "rm -rf /",
+    "rm -rf ~",
+    "rm -rf *",
+    "mkfs.",
+    "dd if=",
+)
+_DESTRUCTIVE_RE = re.compile("|".join(map(re.escape, _DESTRUCTIVE_COMMANDS)), re.IGNORECASE)
+
+# Bytes of stdout and of stderr kept per command; older output is dropped
+_OUTPUT_LIMIT = 1024 * 1024
+
+# Anything bash would expand, redirect or chain; quoting alone is left to shlex
+_SHELL_SYNTAX_RE = re.compile(r"[|&;<>()$`\\*?\[\]{}~#=!\n]")
+
+
+class SafetyCheck(NamedTuple):
+    """Verdict of the command safety check"""
+    safe: bool
+    reason: str
+
+
+@lru_cache(maxsize=1024)
+def _check_safety(content: str) -> SafetyCheck:
+    """
+    Safety verdict for a command or script, memoized per content.
+    
+    The verdict depends only on the content and the module-level patterns,
+    and it is immutable, so cached results can be shared between callers.
+    """
+    # Check for dangerous patterns
+    match = _DANGER_RE.search(content)
+    if match:
+        pattern = _DANGEROUS_PATTERNS[int(match.lastgroup[1:])]
+        return SafetyCheck(False, f"Dangerous command detected: matches pattern '{pattern}'")
+    
+    # Check for destructive commands (basic check)
+    match = _DESTRUCTIVE_RE.search(content)
+    if match:
+        return SafetyCheck(False, f"Potentially destructive command: '{match.group().lower()}'")
+    
+    return SafetyCheck(True, "")
+
+
+@lru_cache(maxsize=256)
+def _which(program: str) -> Optional[str]:
+    """shutil.which, memoized so PATH is scanned once per program name"""
+    return shutil.which(program)
+
+
+def _direct_argv(command: str) -> Optional[List[str]]:
+    """
+    Argument list to exec a simple command without bash, or None.
+    
+    Only commands with no shell syntax whose program is an executable on
+    PATH qualify; builtins, unknown commands and anything shlex cannot
+    split still go through bash so its behaviour and errors are unchanged.
+    """
+    if _SHELL_SYNTAX_RE.search(command):
+        return None
+    try:
+        argv = shlex.split(command)
+    except ValueError:
+        return None
+    if not argv:
+        return None
+    program = _which(argv[0])
+    if program is None:
+        return None
+    return [program] + argv[1:]
+
+
+def _decode_output(data: bytes, errors: str = "strict") -> str:
+    """
+    Decode captured output the way subprocess.run(text=True) does.
+    
+    Uses the locale's preferred encoding and universal newlines, so the
+    streaming and subprocess.run paths return the same text.
+    """
+    text = data.decode(locale.getpreferredencoding(False), errors)
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+class _OutputTail:
+    """
+    The last `limit` bytes written to a stream, kept as a deque of chunks.
+    
+    Chunks that fall entirely before the last `limit` bytes are dropped as
+    they arrive, so memory stays bounded however much a command prints.
+    """
+    
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.chunks = deque()
+        self.size = 0
+        self.dropped = 0
+    
+    def append(self, data: bytes):
+        """Add a chunk, dropping the oldest ones no longer needed"""
+        self.chunks.append(data)
+        self.size += len(data)
+        while self.size - len(self.chunks[0]) >= self.limit:
+            first = self.chunks.popleft()
+            self.size -= len(first)
+            self.dropped += len(first)
+    
+    def text(self) -> str:
+        """Decoded tail, starting with a marker if output was dropped"""
+        data = b"".join(self.chunks)
+        dropped = self.dropped + max(len(data) - self.limit, 0)
+        if not dropped:
+            return _decode_output(data)
+        
+        # The cut may split a character, so decode leniently
+        tail = _decode_output(data[len(data) - self.limit:], errors="replace")
+        return f"[... {dropped} bytes of output truncated ...]\n{tail}"
+
+
+def _run_streaming(argv: List[str], input: Optional[str] = None,
+                   timeout: float = 30) -> subprocess.CompletedProcess:
+    """
+    Run a command, reading stdout and stderr as the process produces them.
+    
+    Output is logged at debug level chunk by chunk while the command runs,
+    and only the last _OUTPUT_LIMIT bytes of each stream are kept, behind a
+    truncation marker. The timeout is enforced by the select loop itself.
+    Windows pipes do not support select, so there the command runs through
+    subprocess.run and its output is kept in full.
+    
+    Args:
+        argv: Command to run
+        input: Optional text written to the command's stdin
+        timeout: Seconds before the process is killed
+    
+    Returns:
+        CompletedProcess with text stdout and stderr
+    
+    Raises:
+        subprocess.TimeoutExpired: If the command ran past timeout
+    """
+    if sys.platform == "win32":
+        return subprocess.run(argv, input=input, capture_output=True, text=True, timeout=timeout)
+    
+    deadline = time.monotonic() + timeout
+    proc = subprocess.Popen(
+        argv,
+        stdin=subprocess.PIPE if input is not None else None,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE
+    )
+    tails = {proc.stdout: _OutputTail(_OUTPUT_LIMIT), proc.stderr: _OutputTail(_OUTPUT_LIMIT)}
+    pending = memoryview(input.encode(locale.getpreferredencoding(False))) if input is not None else None
+    
+    with proc, selectors.DefaultSelector() as selector:
+        selector.register(proc.stdout, selectors.EVENT_READ)
+        selector.register(proc.stderr, selectors.EVENT_READ)
+        if pending:
+            selector.register(proc.stdin, selectors.EVENT_WRITE)
+        elif proc.stdin:
+            proc.stdin.close()
+        
+        while selector.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                proc.kill()
+                proc.wait()
+                raise subprocess.TimeoutExpired(argv, timeout)
+            
+            for key, _ in selector.select(remaining):
+                stream = key.fileobj
+                if stream is proc.stdin:
+                    try:
+                        pending = pending[os.write(stream.fileno(), pending[:select.PIPE_BUF]):]
+                    except BrokenPipeError:
+                        pending = None
+                    if not pending:
+                        selector.unregister(stream)
+                        stream.close()
+                    continue
+                
+                data = os.read(stream.fileno(), 32768)
+                if not data:
+                    selector.unregister(stream)
+                    continue
+                tails[stream].append(data)
+                logger.debug("%s: %s", "stdout" if stream is proc.stdout else "stderr",
+                             data.decode(errors="replace").rstrip())
+        
+        try:
+            proc.wait(timeout=max(deadline - time.monotonic(), 0))
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            raise
+    
+    return subprocess.CompletedProcess(
+        argv,
+        proc.returncode,
+        tails[proc.stdout].text(),
+        tails[proc.stderr].text()
+    )
+
+
+@dataclass(slots=True)
 class AgentResult:
     """Result from agent execution"""
     success: bool
@@ -33,7 +259,7 @@ class AgentResult:
             raise ValueError(f"Confidence must be between 0 and 1, got {self.confidence}")
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """Task representation"""
     id: int
@@ -45,27 +271,25 @@ class Task:
 class BashAgent:
     """Agent for executing shell commands and bash scripts"""
     
+    expertise = (
+        "Shell command execution",
+        "Bash script execution",
+        "File operations",
+        "Process management",
+        "System administration",
+        "Command-line automation"
+    )
+    
+    # Dangerous command patterns to validate
+    dangerous_patterns = _DANGEROUS_PATTERNS
+    
     def __init__(self):
         """Initialize BashAgent"""
-        super().__init__()
-        self.expertise = [
-            "Shell command execution",
-            "Bash script execution",
-            "File operations",
-            "Process management",
-            "System administration",
-            "Command-line automation"
-        ]
-        
-        # Dangerous command patterns to validate
-        self.dangerous_patterns = [
-            r"rm\s+-rf\s+/",  # rm -rf /
-            r"rm\s+-rf\s+~",  # rm -rf ~
-            r":\(\)\{\s*:\|:&\s*\};:",  # Fork bomb
-            r"dd\s+if=.*\s+of=/dev/sd",  # Disk wipe
-            r"mkfs\.",  # Format filesystem
-            r">\s*/dev/sd",  # Write to disk device
-        ]
+        # Shell resolved on PATH once, so each execution execs it by absolute path
+        if sys.platform == "win32":
+            self._shell = shutil.which("powershell") or "powershell"
+        else:
+            self._shell = shutil.which("bash") or "/bin/bash"
     
     def execute(self, task: Task) -> AgentResult:
         """
@@ -105,12 +329,12 @@ class BashAgent:
         # Safety validation
         content = command or script
         safety_check = self._validate_safety(content)
-        if not safety_check["safe"]:
+        if not safety_check.safe:
             return AgentResult(
                 success=False,
                 confidence=0.0,
                 output="",
-                error=safety_check["reason"],
+                error=safety_check.reason,
                 suggestions=["Review command for safety",
                            "Use less destructive alternatives",
                            "Consider running in isolated environment"]
@@ -124,7 +348,7 @@ class BashAgent:
         
         return result
     
-    def _validate_safety(self, content: str) -> Dict[str, Any]:
+    def _validate_safety(self, content: str) -> SafetyCheck:
         """
         Validate command safety.
         
@@ -132,33 +356,9 @@ class BashAgent:
             content: Command or script content
         
         Returns:
-            Dict with 'safe' boolean and 'reason' string
+            SafetyCheck with 'safe' boolean and 'reason' string
         """
-        # Check for dangerous patterns
-        for pattern in self.dangerous_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
-                return {
-                    "safe": False,
-                    "reason": f"Dangerous command detected: matches pattern '{pattern}'"
-                }
-        
-        # Check for destructive commands (basic check)
-        destructive_commands = [
-            "rm -rf /",
-            "rm -rf ~",
-            "rm -rf *",
-            "mkfs.",
-            "dd if=",
-        ]
-        
-        for cmd in destructive_commands:
-            if cmd in content.lower():
-                return {
-                    "safe": False,
-                    "reason": f"Potentially destructive command: '{cmd}'"
-                }
-        
-        return {"safe": True, "reason": ""}
+        return _check_safety(content)
     
     def _execute_command(self, command: str) -> AgentResult:
         """
@@ -176,21 +376,16 @@ class BashAgent:
             # Determine shell
             if sys.platform == "win32":
                 # Use PowerShell on Windows
-                full_command = ["powershell", "-Command", command]
+                full_command = [self._shell, "-Command", command]
             else:
-                # Use bash on Unix-like systems
-                full_command = ["bash", "-c", command]
+                # Simple commands are exec'd directly, skipping a bash
+                # process; everything else runs through bash
+                full_command = _direct_argv(command) or [self._shell, "-c", command]
             
-            result = subprocess.run(
-                full_command,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+            result = _run_streaming(full_command, timeout=30)
             
-            output = result.stdout
-            if result.stderr:
-                output += f"\nStderr: {result.stderr}"
+            # Built in one step rather than appending stderr to stdout
+            output = f"{result.stdout}\nStderr: {result.stderr}" if result.stderr else result.stdout
             
             success = result.returncode == 0
             confidence = 0.9 if success else 0.5
@@ -244,58 +439,32 @@ class BashAgent:
         try:
             logger.info("Executing bash script")
             
-            # Write script to temp file
-            with tempfile.NamedTemporaryFile(
-                mode='w',
-                suffix='.sh' if sys.platform != "win32" else '.ps1',
-                delete=False
-            ) as f:
-                f.write(script)
-                script_path = f.name
+            # The script is fed to the shell on stdin, so no temp file is
+            # written, made executable or cleaned up
+            if sys.platform == "win32":
+                full_command = [self._shell, "-Command", "-"]
+            else:
+                full_command = [self._shell, "-s"]
             
-            try:
-                # Make script executable on Unix
-                if sys.platform != "win32":
-                    Path(script_path).chmod(0o755)
-                
-                # Execute script
-                if sys.platform == "win32":
-                    full_command = ["powershell", "-File", script_path]
-                else:
-                    full_command = ["bash", script_path]
-                
-                result = subprocess.run(
-                    full_command,
-                    capture_output=True,
-                    text=True,
-                    timeout=60
-                )
-                
-                output = result.stdout
-                if result.stderr:
-                    output += f"\nStderr: {result.stderr}"
-                
-                success = result.returncode == 0
-                confidence = 0.9 if success else 0.5
-                
-                suggestions = []
-                if not success:
-                    suggestions.append(f"Script exited with code {result.returncode}")
-                
-                return AgentResult(
-                    success=success,
-                    confidence=confidence,
-                    output=output.strip() if output else "",
-                    error=result.stderr if not success else "",
-                    suggestions=suggestions
-                )
+            result = _run_streaming(full_command, input=script, timeout=60)
+            
+            # Built in one step rather than appending stderr to stdout
+            output = f"{result.stdout}\nStderr: {result.stderr}" if result.stderr else result.stdout
+            
+            success = result.returncode == 0
+            confidence = 0.9 if success else 0.5
+            
+            suggestions = []
+            if not success:
+                suggestions.append(f"Script exited with code {result.returncode}")
             
-            finally:
-                # Cleanup temp script
-                try:
-                    Path(script_path).unlink()
-                except:
-                    pass
+            return AgentResult(
+                success=success,
+                confidence=confidence,
+                output=output.strip() if output else "",
+                error=result.stderr if not success else "",
+                suggestions=suggestions
+            )
         
         except subprocess.TimeoutExpired:
             logger.error("Script execution timed out")
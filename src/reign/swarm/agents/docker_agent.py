@@ -7,12 +7,34 @@ This agent:
 3. Provides confidence scores
 4. Gives suggestions for improvement
 """
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, field
 import re
+import threading
+import time
 
+# Docker SDK is optional; without it the agent runs in mock mode
+try:
+    import docker
+except ImportError:
+    docker = None
 
-@dataclass
+
+# Characters never valid in an image reference
+_BAD_IMAGE_CHARS = frozenset("! @#$%^&*()")
+
+# Must have name, optionally :tag
+_IMAGE_RE = re.compile(r'^[a-zA-Z0-9._/-]+(:[\w][\w.-]*)?$')
+
+
+@lru_cache(maxsize=1024)
+def _is_valid_image_name(image: str) -> bool:
+    """Image name check behind DockerAgent._validate_image_name, memoized per name"""
+    return bool(image) and _BAD_IMAGE_CHARS.isdisjoint(image) and _IMAGE_RE.match(image) is not None
+
+
+@dataclass(slots=True)
 class AgentResult:
     """Result from agent execution"""
     success: bool
@@ -41,6 +63,16 @@ class DockerAgent:
     - Health checks
     """
     
+    # Seconds to wait before reconnecting after Docker was unavailable
+    CLIENT_RETRY_SECONDS = 30.0
+    
+    # Suggested whenever the task leaves the parameter unset
+    _MISSING_PARAM_SUGGESTIONS = (
+        ("healthcheck", "Add health check for production deployments"),
+        ("mem_limit", "Set memory limits to prevent resource exhaustion"),
+        ("restart_policy", "Configure restart policy for automatic recovery"),
+    )
+    
     def __init__(self):
         """Initialize Docker agent"""
         self.name = "DockerAgent"
@@ -53,6 +85,11 @@ class DockerAgent:
             "Resource limits"
         ]
         self.confidence_threshold = 0.7
+        
+        # One Docker client shared by every execute() call, created on first use
+        self._client = None
+        self._client_lock = threading.Lock()
+        self._client_retry_at = 0.0  # when a failed connect may be retried
     
     def execute(self, task) -> AgentResult:
         """
@@ -64,11 +101,38 @@ class DockerAgent:
         Returns:
             AgentResult with success status, confidence, and output
         """
-        # Extract task parameters
-        params = task.params
-        image = params.get("image", "")
+        invalid = self._check_image(task.params)
+        if invalid:
+            return invalid
+        
+        return self._execute_with_client(task.params, self._get_client())
+    
+    def execute_batch(self, tasks) -> List[AgentResult]:
+        """
+        Execute several Docker tasks over the shared Docker client
+        
+        Results are returned in task order.
         
-        # Validate image name
+        Args:
+            tasks: Task objects to execute
+            
+        Returns:
+            One AgentResult per task
+        """
+        results = []
+        for task in tasks:
+            invalid = self._check_image(task.params)
+            if invalid:
+                results.append(invalid)
+                continue
+            
+            results.append(self._execute_with_client(task.params, self._get_client()))
+        
+        return results
+    
+    def _check_image(self, params: Dict[str, Any]) -> Optional[AgentResult]:
+        """Return a failed result if the task's image name is invalid"""
+        image = params.get("image", "")
         if not self._validate_image_name(image):
             return AgentResult(
                 success=False,
@@ -76,12 +140,42 @@ class DockerAgent:
                 error=f"Invalid image name: {image}",
                 self_validated=True
             )
+        return None
+    
+    def _get_client(self):
+        """
+        Return the shared Docker client, or None when the SDK or daemon is unavailable
+        
+        The client is created once and reused. After a failed connect the
+        agent runs in mock mode and only tries again after
+        CLIENT_RETRY_SECONDS, so an unavailable daemon is not probed per task.
+        """
+        client = self._client
+        if client is not None:
+            return client
+        
+        with self._client_lock:
+            if docker is not None and self._client is None and time.monotonic() >= self._client_retry_at:
+                try:
+                    self._client = docker.from_env()
+                except Exception:
+                    self._client_retry_at = time.monotonic() + self.CLIENT_RETRY_SECONDS
+            return self._client
+    
+    def _drop_client(self, client) -> None:
+        """Forget a client that stopped working so the next task reconnects"""
+        with self._client_lock:
+            if self._client is client:
+                self._client = None
+    
+    def _execute_with_client(self, params: Dict[str, Any], client) -> AgentResult:
+        """Run a validated Docker task, falling back to mock without a client"""
+        if client is None:
+            return self._execute_mock(params)
+        
+        image = params.get("image", "")
         
-        # Try to create actual Docker container
         try:
-            import docker
-            client = docker.from_env()
-            
             # Extract container parameters
             name = params.get("name", f"reign-{image.replace(':', '-')[:20]}")
             action = params.get("action", "run")
@@ -150,11 +244,9 @@ class DockerAgent:
                     self_validated=True
                 )
                 
-        except ImportError:
-            # Docker SDK not installed, fall back to mock
-            return self._execute_mock(params)
         except Exception as e:
             # Docker daemon not available, fall back to mock
+            self._drop_client(client)
             return self._execute_mock(params)
     
     def _execute_mock(self, params: Dict[str, Any]) -> AgentResult:
@@ -184,17 +276,7 @@ class DockerAgent:
         - nginx:1.21.0
         - registry.example.com/nginx:latest
         """
-        if not image:
-            return False
-        
-        # Check for invalid characters
-        if any(char in image for char in ["!", " ", "@", "#", "$", "%", "^", "&", "*", "(", ")"]):
-            return False
-        
-        # Basic format check
-        # Must have name, optionally :tag
-        pattern = r'^[a-zA-Z0-9._/-]+(:[\w][\w.-]*)?$'
-        return bool(re.match(pattern, image))
+        return _is_valid_image_name(image)
     
     def _calculate_confidence(self, params: Dict[str, Any]) -> float:
         """
@@ -235,26 +317,14 @@ class DockerAgent:
         
         Based on best practices and missing configurations
         """
-        suggestions = []
-        
         image = params.get("image", "")
         
         # Suggest specific version tags
+        suggestions = []
         if image.endswith(":latest") or ":" not in image:
             suggestions.append("Consider using a specific version tag instead of 'latest'")
         
-        # Suggest health checks
-        if not params.get("healthcheck"):
-            suggestions.append("Add health check for production deployments")
-        
-        # Suggest resource limits
-        if not params.get("mem_limit"):
-            suggestions.append("Set memory limits to prevent resource exhaustion")
-        
-        # Suggest restart policy
-        if not params.get("restart_policy"):
-            suggestions.append("Configure restart policy for automatic recovery")
-        
+        suggestions.extend(message for key, message in self._MISSING_PARAM_SUGGESTIONS if not params.get(key))
         return suggestions
     
     def receive_feedback(self, feedback) -> None:
@@ -3,10 +3,66 @@ GitHub Actions Agent - Orchestrates GitHub Actions workflows and deployments
 """
 
 import json
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 import yaml
 
+# libyaml's C emitter when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+
+
+# Per-language workflow settings
+_RUNNER_MAP = {
+    "python": "ubuntu-latest",
+    "nodejs": "ubuntu-latest",
+    "java": "ubuntu-latest",
+    "go": "ubuntu-latest",
+    "ruby": "ubuntu-latest",
+    "dotnet": "ubuntu-latest"
+}
+
+# (action, version input, version); the step dict is built per call since
+# the build and test jobs each need their own copy, or YAML emits aliases
+_SETUP_STEPS = {
+    "python": ("actions/setup-python@v4", "python-version", "3.11"),
+    "nodejs": ("actions/setup-node@v4", "node-version", "18"),
+    "java": ("actions/setup-java@v4", "java-version", "17"),
+    "go": ("actions/setup-go@v4", "go-version", "1.21"),
+    "ruby": ("actions/setup-ruby@v1", "ruby-version", "3.2"),
+    "dotnet": ("actions/setup-dotnet@v3", "dotnet-version", "7.0")
+}
+
+_BUILD_COMMANDS = {
+    "python": "pip install -r requirements.txt && python -m build",
+    "nodejs": "npm install && npm run build",
+    "java": "mvn clean package -DskipTests",
+    "go": "go build -o app",
+    "ruby": "bundle install && bundle exec rake build",
+    "dotnet": "dotnet build --configuration Release"
+}
+
+_TEST_COMMANDS = {
+    "python": "pytest --cov=src tests/",
+    "nodejs": "npm test -- --coverage",
+    "java": "mvn test",
+    "go": "go test -v -cover ./...",
+    "ruby": "bundle exec rspec",
+    "dotnet": "dotnet test --configuration Release"
+}
+
+
+@lru_cache(maxsize=4096)
+def _parse_repo(repo: str) -> Tuple[str, str]:
+    """Split 'owner/repo' into (owner, repo); ValueError unless there is exactly one '/'"""
+    owner, sep, name = repo.partition("/")
+    if not sep or "/" in name:
+        raise ValueError(f"Repository must be in 'owner/repo' format: {repo}")
+    return owner, name
+
 
 @dataclass
 class AgentResult:
@@ -53,6 +109,16 @@ class GitHubActionsAgent:
             "Accept": "application/vnd.github.v3+json",
             "Content-Type": "application/json"
         }
+        
+        # Action name -> handler, looked up once per task
+        self._dispatch = {
+            "trigger_workflow": self._trigger_workflow,
+            "generate_workflow": self._generate_workflow,
+            "get_status": self._get_workflow_status,
+            "manage_secrets": self._manage_secrets,
+            "list_workflows": self._list_workflows,
+            "get_repo_info": self._get_repo_info
+        }
     
     def execute(self, task: 'Task') -> AgentResult:
         """
@@ -66,19 +132,10 @@ class GitHubActionsAgent:
         """
         try:
             action = task.params.get("action")
+            handler = self._dispatch.get(action)
             
-            if action == "trigger_workflow":
-                return self._trigger_workflow(task.params)
-            elif action == "generate_workflow":
-                return self._generate_workflow(task.params)
-            elif action == "get_status":
-                return self._get_workflow_status(task.params)
-            elif action == "manage_secrets":
-                return self._manage_secrets(task.params)
-            elif action == "list_workflows":
-                return self._list_workflows(task.params)
-            elif action == "get_repo_info":
-                return self._get_repo_info(task.params)
+            if handler is not None:
+                return handler(task.params)
             else:
                 return AgentResult(
                     success=False,
@@ -120,7 +177,7 @@ class GitHubActionsAgent:
                 )
             
             # Build API request
-            owner, repo_name = repo.split("/")
+            owner, repo_name = _parse_repo(repo)
             url = f"{self.api_base}/repos/{owner}/{repo_name}/actions/workflows/{workflow_file}/dispatches"
             
             # Simulated workflow trigger
@@ -182,16 +239,7 @@ class GitHubActionsAgent:
             deploy_target = params.get("deploy_target", "kubernetes")
             
             # Determine runner by language
-            runner_map = {
-                "python": "ubuntu-latest",
-                "nodejs": "ubuntu-latest",
-                "java": "ubuntu-latest",
-                "go": "ubuntu-latest",
-                "ruby": "ubuntu-latest",
-                "dotnet": "ubuntu-latest"
-            }
-            
-            runner = runner_map.get(language, "ubuntu-latest")
+            runner = _RUNNER_MAP.get(language, "ubuntu-latest")
             
             # Build workflow config
             workflow = {
@@ -276,7 +324,7 @@ chmod 600 ~/.kube/config"""
                 }
             
             # Convert to YAML
-            yaml_content = yaml.dump(workflow, default_flow_style=False, sort_keys=False)
+            yaml_content = yaml.dump(workflow, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
             
             output = f"""Generated GitHub Actions workflow for {language}:
 
@@ -302,39 +350,19 @@ To use:
     
     def _get_setup_step(self, language: str) -> Dict:
         """Get language-specific setup step"""
-        setup_map = {
-            "python": {"uses": "actions/setup-python@v4", "with": {"python-version": "3.11"}},
-            "nodejs": {"uses": "actions/setup-node@v4", "with": {"node-version": "18"}},
-            "java": {"uses": "actions/setup-java@v4", "with": {"java-version": "17"}},
-            "go": {"uses": "actions/setup-go@v4", "with": {"go-version": "1.21"}},
-            "ruby": {"uses": "actions/setup-ruby@v1", "with": {"ruby-version": "3.2"}},
-            "dotnet": {"uses": "actions/setup-dotnet@v3", "with": {"dotnet-version": "7.0"}}
-        }
-        return setup_map.get(language, {})
+        setup = _SETUP_STEPS.get(language)
+        if setup is None:
+            return {}
+        uses, version_key, version = setup
+        return {"uses": uses, "with": {version_key: version}}
     
     def _get_build_command(self, language: str) -> str:
         """Get language-specific build command"""
-        commands = {
-            "python": "pip install -r requirements.txt && python -m build",
-            "nodejs": "npm install && npm run build",
-            "java": "mvn clean package -DskipTests",
-            "go": "go build -o app",
-            "ruby": "bundle install && bundle exec rake build",
-            "dotnet": "dotnet build --configuration Release"
-        }
-        return commands.get(language, "echo 'Add build command'")
+        return _BUILD_COMMANDS.get(language, "echo 'Add build command'")
     
     def _get_test_command(self, language: str) -> str:
         """Get language-specific test command"""
-        commands = {
-            "python": "pytest --cov=src tests/",
-            "nodejs": "npm test -- --coverage",
-            "java": "mvn test",
-            "go": "go test -v -cover ./...",
-            "ruby": "bundle exec rspec",
-            "dotnet": "dotnet test --configuration Release"
-        }
-        return commands.get(language, "echo 'Add test command'")
+        return _TEST_COMMANDS.get(language, "echo 'Add test command'")
     
     def _get_workflow_status(self, params: Dict) -> AgentResult:
         """
@@ -531,7 +559,7 @@ Jobs:
             
             # Simulated repo info
             repo_info = {
-                "name": repo.split("/")[1],
+                "name": _parse_repo(repo)[1],
                 "full_name": repo,
                 "description": "Example GitHub repository",
                 "visibility": "public",
@@ -12,6 +12,20 @@ from dataclasses import dataclass
 import re
 import yaml
 
+# libyaml's C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Common hardcoded-secret shapes, as one alternation so YAML is scanned once
+_SECRET_RE = re.compile(
+    r'API_KEY:\s*["\']?sk-\w+'
+    r'|PASSWORD:\s*["\'].+["\']'
+    r'|TOKEN:\s*["\']?\w{20,}',
+    re.IGNORECASE
+)
+
 
 @dataclass
 class AgentResult:
@@ -58,17 +72,23 @@ class GitHubAgent:
     def execute(self, task) -> AgentResult:
         """Execute a GitHub task"""
         params = task.params
+        description = task.description.lower()
         
-        # Determine operation type
-        if "name" in params and "workflow" not in task.description.lower():
+        # Determine operation type; the routing depends on both the
+        # description and params, so it stays a chain of checks
+        if "name" in params and "workflow" not in description:
             return self._create_repository(params)
-        elif "workflow" in task.description.lower() or "workflow_type" in params:
+        elif "workflow" in description or "workflow_type" in params:
             return self._create_workflow(params)
-        elif "pull_request" in task.description.lower() or "title" in params:
+        elif "pull_request" in description or "title" in params:
             return self._create_pull_request(params)
         else:
             return self._create_repository(params)
     
+    def execute_batch(self, tasks) -> List[AgentResult]:
+        """Execute several GitHub tasks, returning results in task order"""
+        return [self.execute(task) for task in tasks]
+    
     def _create_repository(self, params: Dict[str, Any]) -> AgentResult:
         """Create GitHub repository"""
         name = params.get("name", "")
@@ -111,7 +131,7 @@ class GitHubAgent:
         # If YAML provided, validate it
         if workflow_yaml:
             try:
-                yaml.safe_load(workflow_yaml)
+                yaml.load(workflow_yaml, Loader=_YamlLoader)
             except yaml.YAMLError as e:
                 return AgentResult(
                     success=False,
@@ -187,18 +207,7 @@ class GitHubAgent:
     
     def _has_hardcoded_secrets(self, yaml_content: str) -> bool:
         """Detect hardcoded secrets in YAML"""
-        # Look for common secret patterns
-        secret_patterns = [
-            r'API_KEY:\s*["\']?sk-\w+',
-            r'PASSWORD:\s*["\'].+["\']',
-            r'TOKEN:\s*["\']?\w{20,}',
-        ]
-        
-        for pattern in secret_patterns:
-            if re.search(pattern, yaml_content, re.IGNORECASE):
-                return True
-        
-        return False
+        return _SECRET_RE.search(yaml_content) is not None
     
     def _calculate_confidence(self, params: Dict[str, Any]) -> float:
         """Calculate confidence score"""
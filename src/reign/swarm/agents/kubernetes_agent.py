@@ -70,6 +70,10 @@ class KubernetesAgent:
         # Default: Create deployment
         return self._create_deployment(params)
     
+    def execute_batch(self, tasks) -> List[AgentResult]:
+        """Execute several Kubernetes tasks, returning results in task order"""
+        return [self.execute(task) for task in tasks]
+    
     def _create_deployment(self, params: Dict[str, Any]) -> AgentResult:
         """Create a Kubernetes deployment"""
         name = params.get("name", "app")
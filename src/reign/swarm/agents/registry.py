@@ -0,0 +1,72 @@
+"""
+AgentRegistry - Shared, lazily created agent instances
+
+Agent modules pull in heavy dependencies (yaml, subprocess probes for CLIs),
+so the registry only imports an agent's module and builds the agent the
+first time that agent type is looked up. Each agent type is built once and
+then shared by every caller holding the registry.
+"""
+from collections.abc import Mapping
+from importlib import import_module
+from typing import Any, Iterable, Iterator, Optional
+import threading
+
+
+# agent_type -> (module in this package, class name)
+AGENT_CLASSES = {
+    "docker": ("docker_agent", "DockerAgent"),
+    "kubernetes": ("kubernetes_agent", "KubernetesAgent"),
+    "terraform": ("terraform_agent", "TerraformAgent"),
+    "github": ("github_agent", "GitHubAgent"),
+}
+
+
+class AgentRegistry(Mapping):
+    """
+    Read-only mapping of agent type to a shared agent instance
+
+    Lookups are thread-safe; an agent is constructed at most once even when
+    several worker threads ask for it concurrently.
+    """
+
+    def __init__(self, agent_types: Optional[Iterable[str]] = None):
+        """
+        Initialize the registry
+
+        Args:
+            agent_types: Agent types to expose (default: all of AGENT_CLASSES)
+        """
+        self._agent_types = tuple(agent_types) if agent_types is not None else tuple(AGENT_CLASSES)
+        unknown = [t for t in self._agent_types if t not in AGENT_CLASSES]
+        if unknown:
+            raise ValueError(f"Unknown agent types: {unknown}")
+
+        self._agents = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, agent_type: str) -> Any:
+        agent = self._agents.get(agent_type)
+        if agent is not None:
+            return agent
+
+        if agent_type not in self._agent_types:
+            raise KeyError(agent_type)
+
+        with self._lock:
+            agent = self._agents.get(agent_type)
+            if agent is None:
+                module_name, class_name = AGENT_CLASSES[agent_type]
+                module = import_module(f".{module_name}", __package__)
+                agent = getattr(module, class_name)()
+                self._agents[agent_type] = agent
+        return agent
+
+    def __contains__(self, agent_type: object) -> bool:
+        # Membership must not trigger construction
+        return agent_type in self._agent_types
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._agent_types)
+
+    def __len__(self) -> int:
+        return len(self._agent_types)
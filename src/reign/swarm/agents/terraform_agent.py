@@ -80,6 +80,10 @@ class TerraformAgent:
             # Default: Generate config (when no action specified)
             return self._generate_config(params)
     
+    def execute_batch(self, tasks) -> List[AgentResult]:
+        """Execute several Terraform tasks, returning results in task order"""
+        return [self.execute(task) for task in tasks]
+    
     def _generate_config(self, params: Dict[str, Any]) -> AgentResult:
         """Generate Terraform configuration"""
         provider = params.get("provider", "").lower()
@@ -78,6 +78,16 @@ class FeedbackLoop:
         self.feedback_history: List[Feedback] = []
         self.last_result = None
     
+    def reset(self) -> None:
+        """
+        Clear per-execution state so the loop can be reused for another task
+        
+        The retry policy (max_retries, confidence_threshold) is kept.
+        """
+        self.attempt_count = 0
+        self.feedback_history = []
+        self.last_result = None
+    
     def execute_with_feedback(self, agent: Any, task: Any, auto_improve: bool = False) -> Any:
         """
         Execute a task through an agent with feedback-driven retry logic
@@ -90,8 +100,7 @@ class FeedbackLoop:
         Returns:
             AgentResult from the final execution attempt
         """
-        self.attempt_count = 0
-        self.feedback_history = []
+        self.reset()
         current_task = copy.deepcopy(task)
         
         while self.attempt_count < self.max_retries:
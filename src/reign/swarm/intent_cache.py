@@ -0,0 +1,258 @@
+"""
+IntentCache - Persistent cache of understood requests.
+
+Keeps the Intent produced for a natural language request in SQLite so that
+repeated requests (e.g. every demo run) skip LLM and keyword parsing entirely.
+Lookups are exact matches on a hash of the normalized request text (lowercased,
+whitespace collapsed) within a namespace naming what produced the intent, so
+results from different models never mix.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, replace
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .reign_general import Intent
+
+
+logger = logging.getLogger(__name__)
+
+# Numbers and versions ("3", "14", "1.21") - the parts of a request that
+# vary between otherwise identical prompts
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)*\b")
+
+
+class IntentCache:
+    """
+    Disk-backed request -> Intent cache.
+
+    Any error talking to the database is logged and treated as a cache miss,
+    so a broken cache never blocks request understanding.
+    """
+
+    def __init__(self, storage_path: Optional[str] = None):
+        """
+        Initialize IntentCache.
+
+        Args:
+            storage_path: Directory for SQLite database (default: ~/.reign/memory)
+        """
+        if storage_path is None:
+            storage_path = str(Path.home() / ".reign" / "memory")
+
+        self.storage_path = storage_path
+        Path(storage_path).mkdir(parents=True, exist_ok=True)
+        self.db_path = Path(storage_path) / "intent_cache.db"
+
+        self._init_database()
+
+    def _execute(self, sql: str, params: tuple = ()) -> list:
+        """Run one statement in its own committed transaction."""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            rows = conn.execute(sql, params).fetchall()
+            conn.commit()
+            return rows
+        finally:
+            conn.close()
+
+    def _init_database(self):
+        """Initialize SQLite database schema."""
+        try:
+            self._execute("""
+                CREATE TABLE IF NOT EXISTS intents (
+                    request_hash TEXT PRIMARY KEY,
+                    request TEXT NOT NULL,
+                    intent TEXT NOT NULL,
+                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+        except sqlite3.Error as e:
+            logger.error(f"Failed to initialize intent cache: {e}")
+
+    @staticmethod
+    def _hash(user_request: str, namespace: str = "") -> str:
+        """Stable key for a request within a namespace."""
+        normalized = " ".join(user_request.lower().split())
+        key = f"{namespace}\n{normalized}"
+        return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, user_request: str, namespace: str = "") -> Optional[Intent]:
+        """
+        Look up a previously understood request.
+
+        Args:
+            user_request: User's natural language request
+            namespace: What produced the intent (e.g. "ollama:llama3.2:0.7")
+
+        Returns:
+            The cached Intent, or None on a miss
+        """
+        try:
+            rows = self._execute(
+                "SELECT intent FROM intents WHERE request_hash = ?",
+                (self._hash(user_request, namespace),)
+            )
+        except sqlite3.Error as e:
+            logger.error(f"Failed to read intent cache: {e}")
+            return None
+
+        if not rows:
+            return None
+
+        try:
+            return Intent(**json.loads(rows[0][0]))
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Discarding unreadable cached intent: {e}")
+            return None
+
+    def put(self, user_request: str, intent: Intent, namespace: str = ""):
+        """
+        Store the Intent understood for a request.
+
+        Args:
+            user_request: User's natural language request
+            intent: The Intent to cache
+            namespace: What produced the intent (see get())
+        """
+        try:
+            self._execute(
+                "INSERT OR REPLACE INTO intents (request_hash, request, intent) VALUES (?, ?, ?)",
+                (self._hash(user_request, namespace), user_request, json.dumps(asdict(intent)))
+            )
+        except (sqlite3.Error, TypeError) as e:
+            logger.error(f"Failed to write intent cache: {e}")
+
+    def clear(self):
+        """Remove all cached intents."""
+        try:
+            self._execute("DELETE FROM intents")
+        except sqlite3.Error as e:
+            logger.error(f"Failed to clear intent cache: {e}")
+
+
+class IntentTemplateCache:
+    """
+    In-memory LRU of intents keyed by request template.
+
+    A template is the normalized request with every number replaced by
+    ``<*>``, so "Scale the deployment to 5 instances" and "Scale the
+    deployment to 8 instances" share one entry. On a hit the numbers of the
+    new request are substituted into the cached intent's params and
+    description, which saves an LLM call for prompts that only differ in
+    versions or counts.
+    """
+
+    def __init__(self, max_size: int = 256):
+        """
+        Initialize IntentTemplateCache.
+
+        Args:
+            max_size: Maximum number of templates kept (least recently used evicted)
+        """
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _split(user_request: str) -> tuple:
+        """Return (template, numbers) for a request."""
+        normalized = " ".join(user_request.lower().split())
+        return _NUMBER_RE.sub("<*>", normalized), _NUMBER_RE.findall(normalized)
+
+    def get(self, user_request: str) -> Optional[Intent]:
+        """
+        Look up an intent for a request with the same template.
+
+        Args:
+            user_request: User's natural language request
+
+        Returns:
+            The cached Intent adapted to this request's numbers, or None on a
+            miss or when the numbers can't be mapped unambiguously or don't
+            fit the cached param types
+        """
+        template, numbers = self._split(user_request)
+        with self._lock:
+            entry = self._entries.get(template)
+            if entry is None:
+                return None
+            self._entries.move_to_end(template)
+
+        intent, cached_numbers = entry
+        mapping: Dict[str, str] = {}
+        for old, new in zip(cached_numbers, numbers):
+            if mapping.setdefault(old, new) != new:
+                return None  # same number became two different ones
+
+        try:
+            return replace(
+                intent,
+                description=_substitute(intent.description, mapping),
+                params=_substitute(intent.params, mapping),
+            )
+        except ValueError:
+            return None  # new number doesn't fit the cached param's type
+
+    def put(self, user_request: str, intent: Intent):
+        """
+        Store the Intent understood for a request under its template.
+
+        Args:
+            user_request: User's natural language request
+            intent: The Intent to cache
+        """
+        template, numbers = self._split(user_request)
+        with self._lock:
+            # Stored as a private copy so later changes to the caller's
+            # intent don't leak into the template
+            self._entries[template] = (copy.deepcopy(intent), numbers)
+            self._entries.move_to_end(template)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_request: str):
+        """Forget the template of a request, e.g. after a wrong intent."""
+        template, _ = self._split(user_request)
+        with self._lock:
+            self._entries.pop(template, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _substitute(value: Any, mapping: Dict[str, str]) -> Any:
+    """
+    Replace mapped numbers inside strings, numbers and nested containers.
+
+    Containers are always rebuilt, even with an empty mapping, so the result
+    never shares mutable state with the cached intent.
+
+    Raises:
+        ValueError: If a new number can't be converted to the type of the
+            cached one (e.g. "14.5" for an int param)
+    """
+    if isinstance(value, str):
+        if not mapping:
+            return value
+        return _NUMBER_RE.sub(lambda m: mapping.get(m.group(), m.group()), value)
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        new = mapping.get(str(value))
+        if new is None:
+            return value
+        return type(value)(new)
+    if isinstance(value, dict):
+        return {k: _substitute(v, mapping) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_substitute(v, mapping) for v in value]
+    return copy.deepcopy(value)
@@ -14,6 +14,12 @@ from dataclasses import dataclass, field
 from typing import Optional, Dict, Any
 import json
 import os
+import re
+import threading
+
+
+# Outermost {...} span in free-form LLM output
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
 
 
 @dataclass
@@ -186,6 +192,17 @@ Return only valid JSON, no markdown or explanations."""
         )
 
 
+_OLLAMA_SYSTEM_PROMPT = """You are Reign, an infrastructure management AI.
+Parse user requests into structured JSON with:
+- action: (deploy, scale, create, delete, update, monitor)
+- target: (database, kubernetes, docker, terraform, github)
+- description: Brief description
+- confidence: 0.0-1.0
+- params: Dictionary of relevant parameters
+
+Return only valid JSON."""
+
+
 class OllamaProvider(LLMProvider):
     """
     Ollama provider for local models
@@ -197,6 +214,39 @@ class OllamaProvider(LLMProvider):
     def __init__(self, config: LLMConfig):
         super().__init__(config)
         self.base_url = config.base_url
+        self._prompt_context = None
+        self._prompt_context_loaded = False
+        self._prompt_context_lock = threading.Lock()
+    
+    def _get_prompt_context(self) -> Optional[list]:
+        """
+        Token context of the system prompt, evaluated by Ollama once
+        
+        Later requests pass this context and only send their own text, so the
+        model doesn't re-read the system prompt every time. Returns None if
+        the warm-up request fails; callers then send the full prompt.
+        """
+        import requests
+        
+        with self._prompt_context_lock:
+            if not self._prompt_context_loaded:
+                self._prompt_context_loaded = True
+                try:
+                    response = requests.post(
+                        f"{self.base_url}/api/generate",
+                        json={
+                            "model": self.config.model or "llama2",
+                            "prompt": _OLLAMA_SYSTEM_PROMPT,
+                            "stream": False,
+                            "options": {"num_predict": 0}
+                        }
+                    )
+                    context = response.json().get("context") if response.status_code == 200 else None
+                    if isinstance(context, list) and context:
+                        self._prompt_context = context
+                except Exception:
+                    self._prompt_context = None
+            return self._prompt_context
     
     def understand_request(self, user_request: str) -> LLMResponse:
         """
@@ -210,37 +260,77 @@ class OllamaProvider(LLMProvider):
         """
         import requests
         
-        system_prompt = """You are Reign, an infrastructure management AI.
-Parse user requests into structured JSON with:
-- action: (deploy, scale, create, delete, update, monitor)
-- target: (database, kubernetes, docker, terraform, github)
-- description: Brief description
-- confidence: 0.0-1.0
-- params: Dictionary of relevant parameters
-
-Return only valid JSON."""
-        
         payload = {
             "model": self.config.model or "llama2",
-            "prompt": f"{system_prompt}\n\nUser request: {user_request}\n\nJSON response:",
-            "stream": False,
+            "stream": True,
             "temperature": self.config.temperature
         }
         
+        context = self._get_prompt_context()
+        if context:
+            payload["context"] = context
+            payload["prompt"] = f"User request: {user_request}\n\nJSON response:"
+        else:
+            payload["prompt"] = f"{_OLLAMA_SYSTEM_PROMPT}\n\nUser request: {user_request}\n\nJSON response:"
+        
         response = requests.post(
             f"{self.base_url}/api/generate",
-            json=payload
+            json=payload,
+            stream=True
         )
         
-        if response.status_code == 200:
-            data = response.json()
-            return LLMResponse(
-                content=data.get("response", ""),
-                tokens_used=0,  # Ollama doesn't return token count
-                model=data.get("model", self.config.model)
-            )
-        else:
+        if response.status_code != 200:
             raise Exception(f"Ollama request failed: {response.status_code}")
+        
+        # Read the streamed chunks and stop as soon as a complete JSON object
+        # has been generated instead of waiting for the model to finish
+        try:
+            content, model = _read_ollama_stream(response.iter_lines(), self.config.model)
+        finally:
+            response.close()
+        
+        return LLMResponse(
+            content=content,
+            tokens_used=0,  # Ollama doesn't return token count
+            model=model
+        )
+
+
+def _read_ollama_stream(lines, model: Optional[str]) -> "tuple[str, Optional[str]]":
+    """
+    Collect a streamed Ollama /api/generate response
+    
+    Args:
+        lines: Iterable of NDJSON lines from the response
+        model: Model name to report if the stream doesn't include one
+    
+    Returns:
+        (content, model); content is cut at the end of the first complete
+        JSON object once one has been generated
+    """
+    decoder = json.JSONDecoder()
+    text = ""
+    for line in lines:
+        if not line:
+            continue
+        data = json.loads(line)
+        chunk = data.get("response", "")
+        text += chunk
+        model = data.get("model", model)
+        if data.get("done"):
+            break
+        
+        # An object can only have just completed if this chunk closed a brace
+        if "}" in chunk:
+            start = text.find("{")
+            if start != -1:
+                try:
+                    _, end = decoder.raw_decode(text, start)
+                except json.JSONDecodeError:
+                    continue
+                return text[start:end], model
+    
+    return text, model
 
 
 def create_llm_provider(config: LLMConfig) -> LLMProvider:
@@ -297,8 +387,7 @@ def parse_llm_json_response(response: LLMResponse) -> Dict[str, Any]:
         return json.loads(content)
     except json.JSONDecodeError as e:
         # Try to extract JSON from text
-        import re
-        json_match = re.search(r'\{.*\}', content, re.DOTALL)
+        json_match = _JSON_OBJECT_RE.search(content)
         if json_match:
             return json.loads(json_match.group())
         raise ValueError(f"Failed to parse LLM response as JSON: {e}")
@@ -9,7 +9,6 @@ This module provides persistent memory for the REIGN system, enabling:
 """
 
 import sqlite3
-import json
 import logging
 import os
 from datetime import datetime, timedelta
@@ -19,6 +18,7 @@ from dataclasses import asdict
 
 from reign.swarm.reign_general import Task
 from reign.swarm.agents.docker_agent import AgentResult
+from reign.swarm._json import dumps as _dumps, loads as _loads
 
 
 logger = logging.getLogger(__name__)
@@ -182,12 +182,12 @@ class AgentMemory:
                 task.id,
                 task.description,
                 task.agent_type,
-                json.dumps(task.params) if task.params else None,
+                _dumps(task.params) if task.params else None,
                 True,
                 result.confidence,
                 result.execution_time,
-                json.dumps(result.output) if result.output else None,
-                json.dumps(context) if context else None
+                _dumps(result.output) if result.output else None,
+                _dumps(context) if context else None
             ))
             
             conn.commit()
@@ -229,11 +229,11 @@ class AgentMemory:
                 task.id,
                 task.description,
                 task.agent_type,
-                json.dumps(task.params) if task.params else None,
+                _dumps(task.params) if task.params else None,
                 False,
                 error,
                 solution,
-                json.dumps(context) if context else None
+                _dumps(context) if context else None
             ))
             
             conn.commit()
@@ -291,11 +291,11 @@ class AgentMemory:
                 memory = dict(row)
                 # Parse JSON fields
                 if memory["parameters"]:
-                    memory["parameters"] = json.loads(memory["parameters"])
+                    memory["parameters"] = _loads(memory["parameters"])
                 if memory["output"]:
-                    memory["output"] = json.loads(memory["output"])
+                    memory["output"] = _loads(memory["output"])
                 if memory["context"]:
-                    memory["context"] = json.loads(memory["context"])
+                    memory["context"] = _loads(memory["context"])
                 memories.append(memory)
             
             logger.debug(f"Found {len(memories)} similar tasks for agent {agent_type}")
@@ -7,12 +7,54 @@ This is the central "General" that:
 3. Spawns specialized agents
 4. Coordinates execution with feedback loops
 """
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass, field
+from collections import defaultdict
 import re
 import json
 
 
+def _compile_keywords(*keywords: str) -> "re.Pattern":
+    """Compile plain substrings into one alternation, matched in a single scan"""
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+# Intent keyword patterns, checked in priority order by _understand_with_keywords
+_ACTION_PATTERNS = (
+    ("deploy", _compile_keywords("create", "deploy", "set up")),
+    ("delete", _compile_keywords("delete", "remove")),
+    ("scale", _compile_keywords("scale")),
+    ("update", _compile_keywords("update")),
+)
+_KUBERNETES_RE = _compile_keywords("kubernetes", "k8s", "helm")
+_TERRAFORM_RE = _compile_keywords("terraform", "infrastructure")
+_WORKFLOW_RE = _compile_keywords("actions", "workflow")
+_PIPELINE_RE = _compile_keywords("ci", "pipeline")
+_CICD_RE = _compile_keywords("ci/cd", "cicd")
+_REPOSITORY_RE = _compile_keywords("github", "repo")
+_DOCKER_RE = _compile_keywords("container", "docker", "image")
+
+# Part of every intent cache namespace; bump it whenever intent parsing or
+# the Intent fields change so stale cached intents stop being returned
+INTENT_CACHE_VERSION = 1
+
+# Keywords that raise intent confidence, each counted once if it appears anywhere
+_SPECIFIC_KEYWORDS = (
+    "postgresql", "postgres", "mysql", "mongodb", "redis",
+    "nginx", "apache", "node", "react", "vue", "angular",
+    "api", "frontend", "backend", "database", "cache"
+)
+# Zero-width lookahead finds a keyword starting at every position, longest
+# first; a match also implies every shorter keyword that is its prefix
+_SPECIFIC_KEYWORDS_RE = re.compile(
+    "(?=(" + "|".join(map(re.escape, sorted(_SPECIFIC_KEYWORDS, key=len, reverse=True))) + "))"
+)
+_KEYWORD_PREFIXES = {
+    keyword: frozenset(k for k in _SPECIFIC_KEYWORDS if keyword.startswith(k))
+    for keyword in _SPECIFIC_KEYWORDS
+}
+
+
 @dataclass
 class Intent:
     """Represents understanding of user's request"""
@@ -28,9 +70,9 @@ class Intent:
             raise ValueError(f"Confidence must be between 0 and 1, got {self.confidence}")
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
-    """A single task to be executed by an agent"""
+    """A single task to be executed by an agent (slotted: no per-instance __dict__)"""
     id: int
     description: str
     agent_type: str  # docker, kubernetes, terraform, etc.
@@ -39,6 +81,59 @@ class Task:
     priority: int = 0
 
 
+def plan_execution_waves(pairs: List[Tuple[Any, Task]]) -> List[List[Tuple[Any, Task]]]:
+    """
+    Group (agent, task) pairs into waves that can run concurrently
+    
+    Every task in a wave only depends on tasks from earlier waves, so the
+    pairs of one wave can be dispatched in parallel. Dependencies on task
+    ids that are not part of ``pairs`` are treated as already satisfied.
+    
+    Args:
+        pairs: (agent, task) pairs in their original order
+    
+    Returns:
+        List of waves, each preserving the original relative order
+    
+    Raises:
+        ValueError: If the task dependencies contain a cycle
+    """
+    # Kahn's algorithm: count unmet dependencies per task once and keep a
+    # reverse adjacency list, so each edge is visited a single time
+    positions = defaultdict(list)
+    for i, (_, task) in enumerate(pairs):
+        positions[task.id].append(i)
+    
+    indegree = [0] * len(pairs)
+    unblocks = defaultdict(list)
+    for i, (_, task) in enumerate(pairs):
+        for dep in task.depends_on or ():
+            for j in positions.get(dep, ()):
+                indegree[i] += 1
+                unblocks[j].append(i)
+    
+    waves = []
+    scheduled = 0
+    ready = [i for i, count in enumerate(indegree) if count == 0]
+    while ready:
+        waves.append([pairs[i] for i in ready])
+        scheduled += len(ready)
+        
+        next_ready = []
+        for i in ready:
+            for nxt in unblocks[i]:
+                indegree[nxt] -= 1
+                if indegree[nxt] == 0:
+                    next_ready.append(nxt)
+        ready = sorted(next_ready)
+    
+    if scheduled < len(pairs):
+        blocked = [task.id for i, (_, task) in enumerate(pairs) if indegree[i] > 0]
+        raise ValueError(f"Circular task dependencies between tasks {blocked}")
+    
+    return waves
+
+
 class ReignGeneral:
     """
     The General orchestrator that commands the swarm
@@ -47,18 +142,24 @@ class ReignGeneral:
     We'll build it up incrementally using TDD.
     """
     
-    def __init__(self, llm_config=None):
+    def __init__(self, llm_config=None, intent_cache=None, template_cache=None):
         """
         Initialize the General
         
         Args:
             llm_config: Optional LLMConfig for natural language understanding
                        If None, uses keyword matching (fallback mode)
+            intent_cache: Optional IntentCache; LLM-understood requests are
+                         stored there and reused on later calls
+            template_cache: Optional IntentTemplateCache; LLM intents are reused
+                           for requests that differ only in numbers
         """
         self.agents = {}
         self.task_counter = 0
         self.llm_config = llm_config
         self.llm_provider = None
+        self.intent_cache = intent_cache
+        self.template_cache = template_cache
         
         # Initialize LLM provider if config provided
         if llm_config:
@@ -80,22 +181,51 @@ class ReignGeneral:
             except Exception as e:
                 print(f"Warning: Failed to initialize LLM provider: {e}")
                 print("Falling back to keyword matching")
+        
+        # Cached intents are only reused for the same cache version, model and
+        # temperature. Keyword matching is cheaper than a cache lookup, so
+        # without an LLM nothing is cached (namespace None)
+        if self.llm_provider:
+            self.cache_namespace = (
+                f"v{INTENT_CACHE_VERSION}:{llm_config.provider}:{llm_config.model}:{llm_config.temperature}"
+            )
+        else:
+            self.cache_namespace = None
     
     def understand_request(self, user_request: str) -> Intent:
         """
         Parse natural language request into structured Intent
         
-        Uses LLM if configured, otherwise falls back to keyword matching
+        Uses LLM if configured, otherwise falls back to keyword matching.
+        With an intent cache and an LLM, previously understood requests are returned
+        without any parsing; with a template cache, LLM intents are reused
+        for requests that only differ in numbers.
         """
+        use_cache = self.intent_cache is not None and self.cache_namespace is not None
+        if use_cache:
+            cached = self.intent_cache.get(user_request, self.cache_namespace)
+            if cached is not None:
+                return cached
+        
         # Try LLM first if available
         if self.llm_provider:
-            try:
-                return self._understand_with_llm(user_request)
-            except Exception as e:
-                print(f"LLM understanding failed: {e}, falling back to keywords")
+            intent = self.template_cache.get(user_request) if self.template_cache is not None else None
+            if intent is None:
+                try:
+                    intent = self._understand_with_llm(user_request)
+                except Exception as e:
+                    # Degraded keyword results are not cached so the LLM is retried next time
+                    print(f"LLM understanding failed: {e}, falling back to keywords")
+                    return self._understand_with_keywords(user_request)
+                
+                if self.template_cache is not None:
+                    self.template_cache.put(user_request, intent)
+        else:
+            intent = self._understand_with_keywords(user_request)
         
-        # Fallback to keyword matching
-        return self._understand_with_keywords(user_request)
+        if use_cache:
+            self.intent_cache.put(user_request, intent, self.cache_namespace)
+        return intent
     
     def _understand_with_llm(self, user_request: str) -> Intent:
         """
@@ -137,35 +267,31 @@ class ReignGeneral:
         
         # Determine action
         action = "deploy"  # Default
-        if "create" in request_lower or "deploy" in request_lower or "set up" in request_lower:
-            action = "deploy"
-        elif "delete" in request_lower or "remove" in request_lower:
-            action = "delete"
-        elif "scale" in request_lower:
-            action = "scale"
-        elif "update" in request_lower:
-            action = "update"
+        for candidate, pattern in _ACTION_PATTERNS:
+            if pattern.search(request_lower):
+                action = candidate
+                break
         
         # Determine target platform
         target = "docker"  # Default
-        if "kubernetes" in request_lower or "k8s" in request_lower or "helm" in request_lower:
+        if _KUBERNETES_RE.search(request_lower):
             target = "kubernetes"
-        elif "terraform" in request_lower or "infrastructure" in request_lower:
+        elif _TERRAFORM_RE.search(request_lower):
             target = "terraform"
-        elif "github" in request_lower and ("actions" in request_lower or "workflow" in request_lower):
+        elif "github" in request_lower and _WORKFLOW_RE.search(request_lower):
             target = "github_actions"
-        elif "gitlab" in request_lower and ("ci" in request_lower or "pipeline" in request_lower):
+        elif "gitlab" in request_lower and _PIPELINE_RE.search(request_lower):
             target = "gitlab"
-        elif "ci/cd" in request_lower or "cicd" in request_lower:
+        elif _CICD_RE.search(request_lower):
             if "github" in request_lower:
                 target = "github_actions"
             elif "gitlab" in request_lower:
                 target = "gitlab"
             else:
                 target = "github_actions"  # Default for CI/CD
-        elif "github" in request_lower or "repository" in request_lower or "repo" in request_lower:
+        elif _REPOSITORY_RE.search(request_lower):
             target = "github"
-        elif "container" in request_lower or "docker" in request_lower or "image" in request_lower:
+        elif _DOCKER_RE.search(request_lower):
             target = "docker"
         
         # Calculate confidence based on how clear the request is
@@ -191,14 +317,12 @@ class ReignGeneral:
         request_lower = request.lower()
         
         # Boost confidence for specific keywords
-        specific_keywords = [
-            "postgresql", "postgres", "mysql", "mongodb", "redis",
-            "nginx", "apache", "node", "react", "vue", "angular",
-            "api", "frontend", "backend", "database", "cache"
-        ]
-        
-        for keyword in specific_keywords:
-            if keyword in request_lower:
+        found = set()
+        for match in _SPECIFIC_KEYWORDS_RE.finditer(request_lower):
+            found |= _KEYWORD_PREFIXES[match.group(1)]
+        
+        for keyword in _SPECIFIC_KEYWORDS:
+            if keyword in found:
                 confidence += 0.05
         
         # Reduce confidence for vague requests
@@ -9,7 +9,6 @@ Provides:
 """
 
 import sqlite3
-import json
 import logging
 import os
 import uuid
@@ -18,11 +17,13 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, field, asdict
 
+from .._json import dumps as _dumps, loads as _loads
+
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceState:
     """Represents deployed infrastructure resource state."""
     resource_id: str
@@ -61,6 +62,9 @@ class StateManager:
     - Persists state in SQLite database
     """
     
+    # A chain of delta checkpoints is cut with a full snapshot after this many links
+    MAX_DELTA_CHAIN = 10
+    
     def __init__(self, storage_path: Optional[str] = None):
         """
         Initialize StateManager.
@@ -159,32 +163,50 @@ class StateManager:
         Args:
             resource: ResourceState to record
         """
+        self.record_deployments([resource])
+    
+    def record_deployments(self, resources: List[ResourceState]):
+        """
+        Record several deployed resources in one transaction.
+        
+        Args:
+            resources: ResourceStates to record
+        """
+        if not resources:
+            return
+        
         conn = None
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = sqlite3.connect(self.db_path, isolation_level=None)
             cursor = conn.cursor()
             
-            cursor.execute("""
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.executemany("""
                 INSERT OR REPLACE INTO resources (
                     resource_id, resource_type, name, metadata,
                     agent_type, depends_on, status, deployed_at
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                resource.resource_id,
-                resource.resource_type,
-                resource.name,
-                json.dumps(resource.metadata),
-                resource.agent_type,
-                json.dumps(resource.depends_on) if resource.depends_on else None,
-                resource.status,
-                resource.deployed_at
-            ))
+            """, [
+                (
+                    resource.resource_id,
+                    resource.resource_type,
+                    resource.name,
+                    _dumps(resource.metadata),
+                    resource.agent_type,
+                    _dumps(resource.depends_on) if resource.depends_on else None,
+                    resource.status,
+                    resource.deployed_at
+                )
+                for resource in resources
+            ])
+            cursor.execute("COMMIT")
             
-            conn.commit()
-            logger.debug(f"Recorded deployment: {resource.resource_id}")
+            logger.debug(f"Recorded deployment: {', '.join(r.resource_id for r in resources)}")
             
         except sqlite3.Error as e:
             logger.error(f"Failed to record deployment: {e}")
+            if conn and conn.in_transaction:
+                conn.rollback()
         finally:
             if conn:
                 conn.close()
@@ -214,9 +236,9 @@ class StateManager:
             if row:
                 state = dict(row)
                 if state["metadata"]:
-                    state["metadata"] = json.loads(state["metadata"])
+                    state["metadata"] = _loads(state["metadata"])
                 if state["depends_on"]:
-                    state["depends_on"] = json.loads(state["depends_on"])
+                    state["depends_on"] = _loads(state["depends_on"])
                 return state
             return None
             
@@ -250,10 +272,10 @@ class StateManager:
             for row in rows:
                 state = dict(row)
                 if state["depends_on"]:
-                    deps = json.loads(state["depends_on"])
+                    deps = _loads(state["depends_on"])
                     if resource_id in deps:
                         if state["metadata"]:
-                            state["metadata"] = json.loads(state["metadata"])
+                            state["metadata"] = _loads(state["metadata"])
                         state["depends_on"] = deps
                         dependents.append(state)
             
@@ -281,9 +303,9 @@ class StateManager:
             for row in rows:
                 state = dict(row)
                 if state["metadata"]:
-                    state["metadata"] = json.loads(state["metadata"])
+                    state["metadata"] = _loads(state["metadata"])
                 if state["depends_on"]:
-                    state["depends_on"] = json.loads(state["depends_on"])
+                    state["depends_on"] = _loads(state["depends_on"])
                 resources.append(state)
             
             return resources
@@ -295,12 +317,14 @@ class StateManager:
             if conn:
                 conn.close()
     
-    def create_checkpoint(self, description: str) -> str:
+    def create_checkpoint(self, description: str, base: Optional[str] = None) -> str:
         """
         Create a state checkpoint for rollback.
         
         Args:
             description: Description of checkpoint
+            base: Optional earlier checkpoint; only the resources changed or
+                removed since it are stored
             
         Returns:
             Checkpoint ID
@@ -313,6 +337,18 @@ class StateManager:
             conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
             
+            snapshot = resources
+            if base:
+                resolved = self._load_snapshot(cursor, base)
+                if resolved and resolved[1] < self.MAX_DELTA_CHAIN:
+                    previous = {r["resource_id"]: r for r in resolved[0]}
+                    current_ids = {r["resource_id"] for r in resources}
+                    snapshot = {
+                        "base": base,
+                        "changed": [r for r in resources if previous.get(r["resource_id"]) != r],
+                        "removed": [rid for rid in previous if rid not in current_ids]
+                    }
+            
             cursor.execute("""
                 INSERT INTO checkpoints (
                     checkpoint_id, description, resource_count, state_snapshot
@@ -321,7 +357,7 @@ class StateManager:
                 checkpoint_id,
                 description,
                 len(resources),
-                json.dumps(resources)
+                _dumps(snapshot)
             ))
             
             conn.commit()
@@ -336,6 +372,46 @@ class StateManager:
             if conn:
                 conn.close()
     
+    def _load_snapshot(self, cursor, checkpoint_id: str) -> Optional[tuple]:
+        """
+        Resolve a checkpoint to the full list of resources it recorded.
+        
+        A full snapshot is stored as a list; a delta checkpoint stores a dict
+        naming its base, which is followed until a full snapshot is reached.
+        
+        Args:
+            cursor: Open cursor on the state database
+            checkpoint_id: Checkpoint to resolve
+            
+        Returns:
+            (resources, number of deltas applied), or None if a checkpoint
+            in the chain is missing
+        """
+        deltas = []
+        while True:
+            cursor.execute("""
+                SELECT state_snapshot FROM checkpoints WHERE checkpoint_id = ?
+            """, (checkpoint_id,))
+            
+            row = cursor.fetchone()
+            if not row:
+                return None
+            
+            snapshot = _loads(row[0])
+            if isinstance(snapshot, list):
+                break
+            deltas.append(snapshot)
+            checkpoint_id = snapshot["base"]
+        
+        state = {r["resource_id"]: r for r in snapshot}
+        for delta in reversed(deltas):
+            for resource_id in delta["removed"]:
+                state.pop(resource_id, None)
+            for resource in delta["changed"]:
+                state[resource["resource_id"]] = resource
+        
+        return list(state.values()), len(deltas)
+    
     def list_checkpoints(self) -> List[Dict[str, Any]]:
         """List all checkpoints."""
         conn = None
@@ -377,16 +453,12 @@ class StateManager:
             cursor = conn.cursor()
             
             # Get checkpoint
-            cursor.execute("""
-                SELECT state_snapshot FROM checkpoints WHERE checkpoint_id = ?
-            """, (checkpoint_id,))
-            
-            row = cursor.fetchone()
-            if not row:
+            resolved = self._load_snapshot(cursor, checkpoint_id)
+            if not resolved:
                 logger.error(f"Checkpoint {checkpoint_id} not found")
                 return False
             
-            snapshot = json.loads(row["state_snapshot"])
+            snapshot = resolved[0]
             
             # Clear current state and restore snapshot
             cursor.execute("DELETE FROM resources")
@@ -401,9 +473,9 @@ class StateManager:
                     resource["resource_id"],
                     resource["resource_type"],
                     resource["name"],
-                    json.dumps(resource["metadata"]),
+                    _dumps(resource["metadata"]),
                     resource["agent_type"],
-                    json.dumps(resource["depends_on"]) if resource.get("depends_on") else None,
+                    _dumps(resource["depends_on"]) if resource.get("depends_on") else None,
                     resource["status"],
                     resource["deployed_at"]
                 ))
@@ -436,15 +508,11 @@ class StateManager:
             cursor = conn.cursor()
             
             # Get checkpoint state
-            cursor.execute("""
-                SELECT state_snapshot FROM checkpoints WHERE checkpoint_id = ?
-            """, (checkpoint_id,))
-            
-            row = cursor.fetchone()
-            if not row:
+            resolved = self._load_snapshot(cursor, checkpoint_id)
+            if not resolved:
                 return {"error": "Checkpoint not found"}
             
-            checkpoint_resources = json.loads(row["state_snapshot"])
+            checkpoint_resources = resolved[0]
             checkpoint_ids = {r["resource_id"] for r in checkpoint_resources}
             
             # Get current state
@@ -574,9 +642,9 @@ class StateManager:
             for row in rows:
                 state = dict(row)
                 if state["metadata"]:
-                    state["metadata"] = json.loads(state["metadata"])
+                    state["metadata"] = _loads(state["metadata"])
                 if state["depends_on"]:
-                    state["depends_on"] = json.loads(state["depends_on"])
+                    state["depends_on"] = _loads(state["depends_on"])
                 resources.append(state)
             
             return resources
@@ -607,9 +675,9 @@ class StateManager:
             for row in rows:
                 state = dict(row)
                 if state["metadata"]:
-                    state["metadata"] = json.loads(state["metadata"])
+                    state["metadata"] = _loads(state["metadata"])
                 if state["depends_on"]:
-                    state["depends_on"] = json.loads(state["depends_on"])
+                    state["depends_on"] = _loads(state["depends_on"])
                 resources.append(state)
             
             return resources
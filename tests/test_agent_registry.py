@@ -0,0 +1,50 @@
+"""
+Tests for AgentRegistry - shared, lazily created agent instances
+"""
+import pytest
+
+from reign.swarm.agents.registry import AgentRegistry, AGENT_CLASSES
+from reign.swarm.agents.docker_agent import DockerAgent
+
+
+class TestAgentRegistry:
+    """Test lazy agent lookup"""
+    
+    def test_lookup_returns_agent_instance(self):
+        """Test: Looking up an agent type returns that agent"""
+        registry = AgentRegistry()
+        
+        assert isinstance(registry["docker"], DockerAgent)
+    
+    def test_agent_is_built_once(self):
+        """Test: Repeated lookups share one instance"""
+        registry = AgentRegistry()
+        
+        assert registry["kubernetes"] is registry["kubernetes"]
+    
+    def test_agents_are_not_built_until_used(self):
+        """Test: Creating the registry doesn't construct any agents"""
+        registry = AgentRegistry()
+        
+        assert "terraform" in registry
+        assert registry._agents == {}
+    
+    def test_restricted_agent_types(self):
+        """Test: A registry can expose a subset of agent types"""
+        registry = AgentRegistry(["docker"])
+        
+        assert list(registry) == ["docker"]
+        with pytest.raises(KeyError):
+            registry["github"]
+    
+    def test_unknown_agent_type_rejected(self):
+        """Test: Unknown agent types are reported up front"""
+        with pytest.raises(ValueError):
+            AgentRegistry(["docker", "mainframe"])
+    
+    def test_iterates_all_known_agent_types(self):
+        """Test: The default registry covers every registered agent"""
+        registry = AgentRegistry()
+        
+        assert set(registry) == set(AGENT_CLASSES)
+        assert len(registry) == len(AGENT_CLASSES)
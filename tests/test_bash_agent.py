@@ -91,6 +91,28 @@ class TestBashCommandExecution:
         assert result.output is not None
         assert "test123" in result.output
     
+    @pytest.mark.skipif(sys.platform == "win32", reason="output is only capped on the streaming path")
+    def test_keeps_only_the_tail_of_large_output(self, monkeypatch):
+        """Test that output past the limit is dropped behind a marker"""
+        from reign.swarm.agents import bash_agent
+        monkeypatch.setattr(bash_agent, "_OUTPUT_LIMIT", 100)
+        agent = BashAgent()
+        
+        task = Task(
+            id=1,
+            description="Run command with a lot of output",
+            agent_type="bash",
+            params={"command": "seq 1 100000"}
+        )
+        
+        result = agent.execute(task)
+        
+        assert result.success
+        assert result.output.startswith("[... ")
+        assert "bytes of output truncated ...]" in result.output
+        assert result.output.endswith("99999\n100000")
+        assert len(result.output) < 200
+    
     def test_handles_command_errors(self):
         """Test handling of failed commands"""
         agent = BashAgent()
@@ -7,7 +7,10 @@ TDD Approach:
 3. Add more complex tests
 4. Iterate
 """
+from unittest.mock import MagicMock, patch
+
 import pytest
+from reign.swarm.agents import docker_agent
 from reign.swarm.agents.docker_agent import DockerAgent, AgentResult
 from reign.swarm.reign_general import Task
 
@@ -79,6 +82,40 @@ class TestDockerAgentExecution:
         # Should fail validation
         assert result.success == False
         assert "invalid" in result.error.lower() or "image" in result.error.lower()
+    
+    def test_execute_batch_returns_results_in_task_order(self):
+        """Test: Batch execution returns one result per task, in order"""
+        agent = DockerAgent()
+        tasks = [
+            Task(id=1, description="Deploy DB", agent_type="docker", params={"image": "postgres:14"}),
+            Task(id=2, description="Bad image", agent_type="docker", params={"image": "bad!!image"}),
+            Task(id=3, description="Deploy cache", agent_type="docker", params={"image": "redis:7"}),
+        ]
+        
+        results = agent.execute_batch(tasks)
+        
+        assert len(results) == 3
+        assert results[1].success == False
+        assert "invalid" in results[1].error.lower()
+        assert results[0].output.get("image") == "postgres:14"
+        assert results[2].output.get("image") == "redis:7"
+    
+    def test_docker_client_is_reused_across_tasks(self):
+        """Test: The Docker client is created once, not per task"""
+        agent = DockerAgent()
+        client = MagicMock()
+        client.containers.run.return_value.id = "0123456789abcdef"
+        fake_docker = MagicMock()
+        fake_docker.from_env.return_value = client
+        
+        with patch.object(docker_agent, "docker", fake_docker):
+            for i in range(3):
+                result = agent.execute(Task(id=i, description="Run nginx", agent_type="docker",
+                                            params={"image": "nginx:1.25", "name": f"web-{i}"}))
+                assert result.output["container_id"] == "0123456789ab"
+        
+        assert fake_docker.from_env.call_count == 1
+        assert client.containers.run.call_count == 3
 
 
 class TestDockerAgentSelfValidation:
@@ -119,6 +119,20 @@ class TestFeedbackLoop:
             # Check that feedback was generated
             assert len(loop.feedback_history) > 0
     
+    def test_reset_clears_execution_state(self):
+        loop = FeedbackLoop(max_retries=2, confidence_threshold=0.99)
+        agent = DockerAgent()
+        task = Task(id=1, description="Deploy", agent_type="docker", params={"image": "nginx"})
+        loop.execute_with_feedback(agent, task)
+        
+        loop.reset()
+        
+        assert loop.attempt_count == 0
+        assert loop.feedback_history == []
+        assert loop.last_result is None
+        assert loop.max_retries == 2
+        assert loop.confidence_threshold == 0.99
+    
     def test_get_feedback_summary(self):
         """Test feedback summary generation"""
         loop = FeedbackLoop(max_retries=3, confidence_threshold=0.75)
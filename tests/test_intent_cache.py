@@ -0,0 +1,180 @@
+"""
+Tests for IntentCache - persistent cache of understood requests
+"""
+import pytest
+
+from unittest.mock import Mock
+
+from reign.swarm.intent_cache import IntentCache, IntentTemplateCache
+from reign.swarm.reign_general import ReignGeneral, Intent, INTENT_CACHE_VERSION
+
+
+class TestIntentCache:
+    """Test storing and retrieving intents"""
+    
+    def test_miss_returns_none(self, tmp_path):
+        """Test: Unknown requests are a cache miss"""
+        cache = IntentCache(storage_path=str(tmp_path))
+        
+        assert cache.get("Deploy nginx") is None
+    
+    def test_put_then_get_round_trips_intent(self, tmp_path):
+        """Test: A stored intent comes back unchanged"""
+        cache = IntentCache(storage_path=str(tmp_path))
+        intent = Intent(action="deploy", target="docker", description="Deploy nginx",
+                        confidence=0.8, params={"port": 80})
+        
+        cache.put("Deploy nginx", intent)
+        
+        assert cache.get("Deploy nginx") == intent
+    
+    def test_cache_persists_across_instances(self, tmp_path):
+        """Test: Intents survive a new cache instance on the same path"""
+        intent = Intent(action="scale", target="kubernetes", description="Scale k8s", confidence=0.7)
+        IntentCache(storage_path=str(tmp_path)).put("Scale k8s", intent)
+        
+        assert IntentCache(storage_path=str(tmp_path)).get("Scale k8s") == intent
+    
+    def test_requests_are_normalized(self, tmp_path):
+        """Test: Case and whitespace differences hit the same entry"""
+        cache = IntentCache(storage_path=str(tmp_path))
+        intent = Intent("deploy", "docker", "Deploy nginx", 0.8)
+        cache.put("Deploy  nginx\n", intent)
+        
+        assert cache.get("deploy nginx") == intent
+    
+    def test_namespaces_are_isolated(self, tmp_path):
+        """Test: An intent cached for one model is not returned for another"""
+        cache = IntentCache(storage_path=str(tmp_path))
+        cache.put("Deploy nginx", Intent("deploy", "docker", "Deploy nginx", 0.9), "ollama:llama3.2:0.7")
+        
+        assert cache.get("Deploy nginx", "ollama:mistral:0.7") is None
+        assert cache.get("Deploy nginx", "ollama:llama3.2:0.7") is not None
+    
+    def test_clear_removes_entries(self, tmp_path):
+        """Test: clear() empties the cache"""
+        cache = IntentCache(storage_path=str(tmp_path))
+        cache.put("Deploy nginx", Intent("deploy", "docker", "Deploy nginx", 0.8))
+        
+        cache.clear()
+        
+        assert cache.get("Deploy nginx") is None
+
+
+class TestIntentTemplateCache:
+    """Test reusing intents for requests that only differ in numbers"""
+    
+    def test_numbers_are_substituted_on_hit(self):
+        """Test: A cached template yields an intent with the new numbers"""
+        cache = IntentTemplateCache()
+        cache.put("Deploy PostgreSQL 14 with 3 replicas",
+                  Intent("deploy", "database", "Deploy PostgreSQL 14", 0.9,
+                         {"version": "14", "replicas": 3}))
+        
+        intent = cache.get("Deploy PostgreSQL 15 with 5 replicas")
+        
+        assert intent.description == "Deploy PostgreSQL 15"
+        assert intent.params == {"version": "15", "replicas": 5}
+    
+    def test_returned_intent_does_not_share_cached_params(self):
+        """Test: Mutating a returned or stored intent leaves the cache intact"""
+        cache = IntentTemplateCache()
+        stored = Intent("deploy", "docker", "Deploy nginx", 0.9, {"ports": [80]})
+        cache.put("Deploy nginx", stored)
+        stored.params["ports"].append(443)
+        
+        cache.get("Deploy nginx").params["ports"].append(8080)
+        
+        assert cache.get("Deploy nginx").params == {"ports": [80]}
+    
+    def test_number_that_does_not_fit_param_type_misses(self):
+        """Test: A float version against a cached int version is a miss"""
+        cache = IntentTemplateCache()
+        cache.put(
+            "Deploy PostgreSQL 14",
+            Intent("deploy", "docker", "Deploy PostgreSQL 14", 0.9, {"version": 14}),
+        )
+        
+        assert cache.get("Deploy PostgreSQL 14.5") is None
+        assert cache.get("Deploy PostgreSQL 15").params == {"version": 15}
+    
+    def test_different_template_misses(self):
+        """Test: Requests with different wording are a miss"""
+        cache = IntentTemplateCache()
+        cache.put("Deploy PostgreSQL 14", Intent("deploy", "database", "x", 0.9))
+        
+        assert cache.get("Delete PostgreSQL 14") is None
+    
+    def test_least_recently_used_template_is_evicted(self):
+        """Test: The cache is bounded by max_size"""
+        cache = IntentTemplateCache(max_size=1)
+        cache.put("Deploy nginx", Intent("deploy", "docker", "x", 0.9))
+        cache.put("Scale nginx to 2", Intent("scale", "docker", "x", 0.9))
+        
+        assert len(cache) == 1
+        assert cache.get("Deploy nginx") is None
+    
+    def test_invalidate_forgets_template(self):
+        """Test: invalidate() drops a wrong intent"""
+        cache = IntentTemplateCache()
+        cache.put("Scale nginx to 2", Intent("scale", "docker", "x", 0.9))
+        
+        cache.invalidate("Scale nginx to 7")
+        
+        assert cache.get("Scale nginx to 2") is None
+
+
+class TestReignGeneralWithIntentCache:
+    """Test ReignGeneral using an intent cache"""
+    
+    def _llm_general(self, cache, intent):
+        """ReignGeneral with a stubbed LLM returning intent"""
+        reign = ReignGeneral(intent_cache=cache)
+        reign.llm_provider = Mock()
+        reign.cache_namespace = f"v{INTENT_CACHE_VERSION}:test:model:0.7"
+        reign._understand_with_llm = Mock(return_value=intent)
+        return reign
+    
+    def test_understood_request_is_cached(self, tmp_path):
+        """Test: understand_request stores its LLM result"""
+        cache = IntentCache(storage_path=str(tmp_path))
+        reign = self._llm_general(cache, Intent("deploy", "docker", "x", 0.9))
+        
+        intent = reign.understand_request("Deploy a PostgreSQL database")
+        
+        assert cache.get("Deploy a PostgreSQL database", reign.cache_namespace) == intent
+    
+    def test_cache_hit_skips_parsing(self, tmp_path):
+        """Test: A cached intent is returned without calling the LLM"""
+        cache = IntentCache(storage_path=str(tmp_path))
+        cached = Intent(action="delete", target="terraform", description="x", confidence=0.9)
+        reign = self._llm_general(cache, Intent("deploy", "docker", "x", 0.9))
+        cache.put("Deploy a PostgreSQL database", cached, reign.cache_namespace)
+        
+        assert reign.understand_request("Deploy a PostgreSQL database") == cached
+        assert reign._understand_with_llm.call_count == 0
+    
+    def test_keyword_mode_does_not_use_cache(self, tmp_path):
+        """Test: Keyword intents are recomputed, never read from or written to disk"""
+        cache = IntentCache(storage_path=str(tmp_path))
+        stale = Intent(action="delete", target="terraform", description="x", confidence=0.9)
+        cache.put("Deploy a PostgreSQL database", stale, "keywords")
+        reign = ReignGeneral(intent_cache=cache)
+        
+        intent = reign.understand_request("Deploy a PostgreSQL database")
+        
+        assert intent.action == "deploy"
+        assert reign.cache_namespace is None
+    
+    def test_template_hit_skips_llm(self):
+        """Test: A request differing only in numbers reuses the LLM intent"""
+        reign = ReignGeneral(template_cache=IntentTemplateCache())
+        reign.llm_provider = Mock()
+        reign._understand_with_llm = Mock(return_value=Intent(
+            "scale", "kubernetes", "Scale to 5", 0.9, {"replicas": 5}))
+        
+        reign.understand_request("Scale the deployment to 5 instances")
+        intent = reign.understand_request("Scale the deployment to 8 instances")
+        
+        assert reign._understand_with_llm.call_count == 1
+        assert intent.params == {"replicas": 8}
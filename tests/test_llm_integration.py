@@ -126,10 +126,10 @@ class TestOllamaProvider:
     def test_ollama_understand_request(self, mock_post):
         """Test Ollama can understand natural language requests"""
         mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "response": '{"action": "create", "target": "container"}',
-            "model": "llama2"
-        }
+        mock_response.iter_lines.return_value = [
+            b'{"model": "llama2", "response": "{\\"action\\": \\"create\\", ", "done": false}',
+            b'{"model": "llama2", "response": "\\"target\\": \\"container\\"}", "done": false}',
+        ]
         mock_response.status_code = 200
         mock_post.return_value = mock_response
         
@@ -140,6 +140,49 @@ class TestOllamaProvider:
         
         assert response.content is not None
         assert response.model == "llama2"
+    
+    @patch('requests.post')
+    def test_ollama_stops_reading_after_complete_json(self, mock_post):
+        """Test Ollama streaming returns once a full JSON object has arrived"""
+        mock_response = MagicMock()
+        mock_response.iter_lines.return_value = iter([
+            b'{"model": "llama2", "response": "{\\"action\\": ", "done": false}',
+            b'{"model": "llama2", "response": "\\"deploy\\"}", "done": false}',
+            b'{"model": "llama2", "response": " Hope this helps!", "done": false}',
+            b'{"model": "llama2", "response": "", "done": true}',
+        ])
+        mock_response.status_code = 200
+        mock_post.return_value = mock_response
+        
+        provider = OllamaProvider(LLMConfig(provider="ollama", model="llama2"))
+        
+        response = provider.understand_request("Deploy something")
+        
+        assert response.content == '{"action": "deploy"}'
+        assert next(mock_response.iter_lines.return_value)  # rest left unread
+        mock_response.close.assert_called_once()
+    
+    @patch('requests.post')
+    def test_ollama_reuses_system_prompt_context(self, mock_post):
+        """Test Ollama evaluates the system prompt once and reuses its context"""
+        warmup = MagicMock(status_code=200)
+        warmup.json.return_value = {"context": [1, 2, 3]}
+        
+        def generate(*args, **kwargs):
+            response = MagicMock(status_code=200)
+            response.iter_lines.return_value = [b'{"model": "llama2", "response": "{}", "done": true}']
+            return response
+        
+        mock_post.side_effect = [warmup, generate(), generate()]
+        provider = OllamaProvider(LLMConfig(provider="ollama", model="llama2"))
+        
+        provider.understand_request("Create a container")
+        provider.understand_request("Delete a container")
+        
+        assert mock_post.call_count == 3
+        last_payload = mock_post.call_args.kwargs["json"]
+        assert last_payload["context"] == [1, 2, 3]
+        assert "You are Reign" not in last_payload["prompt"]
 
 
 class TestReignGeneralWithLLM:
@@ -8,7 +8,7 @@ Following TDD:
 4. Repeat
 """
 import pytest
-from reign.swarm.reign_general import ReignGeneral, Intent, Task
+from reign.swarm.reign_general import ReignGeneral, Intent, Task, plan_execution_waves
 
 
 class TestReignGeneral:
@@ -44,6 +44,18 @@ class TestReignGeneral:
         # Simple request should have high confidence
         assert intent.confidence > 0.7
     
+    def test_confidence_counts_every_keyword_substring(self):
+        """Test: Each keyword found anywhere adds 0.05, including overlapping ones"""
+        reign = ReignGeneral()
+        
+        intent = reign.understand_request(
+            "Deploy a PostgreSQL database with Redis cache for a web application"
+        )
+        
+        # postgresql, postgres, redis, database, cache
+        assert intent.confidence == pytest.approx(0.95)
+        assert reign._calculate_confidence("rapid rollout please", "deploy", "docker") == pytest.approx(0.75)
+    
     def test_decompose_simple_task(self, sample_request):
         """Test 4: Can Reign break down a simple task?"""
         reign = ReignGeneral()
@@ -145,3 +157,51 @@ class TestTask:
         
         assert 1 in task2.depends_on
         assert len(task2.depends_on) == 1
+    
+    def test_task_uses_slots(self):
+        """Test: Tasks are slotted and carry no per-instance __dict__"""
+        task = Task(id=1, description="Create DB", agent_type="docker")
+        
+        assert not hasattr(task, "__dict__")
+
+
+class TestExecutionWaves:
+    """Test grouping of tasks into concurrent execution waves"""
+    
+    def test_independent_tasks_share_one_wave(self):
+        """Test: Tasks without dependencies run in a single wave"""
+        pairs = [("a", Task(id=i, description=f"Task {i}", agent_type="docker")) for i in range(1, 4)]
+        
+        waves = plan_execution_waves(pairs)
+        
+        assert len(waves) == 1
+        assert [task.id for _, task in waves[0]] == [1, 2, 3]
+    
+    def test_dependencies_split_into_ordered_waves(self):
+        """Test: Dependent tasks land in a later wave than their dependencies"""
+        pairs = [
+            ("api", Task(id=3, description="Create API", agent_type="docker", depends_on=[1])),
+            ("db", Task(id=1, description="Create DB", agent_type="docker")),
+            ("ui", Task(id=4, description="Create UI", agent_type="docker", depends_on=[3])),
+            ("cache", Task(id=2, description="Create cache", agent_type="docker")),
+        ]
+        
+        waves = plan_execution_waves(pairs)
+        
+        assert [[task.id for _, task in wave] for wave in waves] == [[1, 2], [3], [4]]
+    
+    def test_unknown_dependency_is_treated_as_satisfied(self):
+        """Test: Dependencies outside the batch don't block a task"""
+        pairs = [("a", Task(id=2, description="Create API", agent_type="docker", depends_on=[99]))]
+        
+        assert len(plan_execution_waves(pairs)) == 1
+    
+    def test_circular_dependencies_raise(self):
+        """Test: A dependency cycle is reported instead of looping forever"""
+        pairs = [
+            ("a", Task(id=1, description="A", agent_type="docker", depends_on=[2])),
+            ("b", Task(id=2, description="B", agent_type="docker", depends_on=[1])),
+        ]
+        
+        with pytest.raises(ValueError):
+            plan_execution_waves(pairs)
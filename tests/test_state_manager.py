@@ -86,6 +86,29 @@ class TestStateManagerBasics:
             assert len(deps) == 1
             assert deps[0]["resource_id"] == "service-1"
 
+    
+    def test_records_multiple_deployments(self):
+        """Test recording several resources in one call."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = StateManager(storage_path=tmpdir)
+            
+            resources = [
+                ResourceState(
+                    resource_id=f"container-{i}",
+                    resource_type="docker_container",
+                    name=f"app-{i}",
+                    metadata={"image": "app:1.0"},
+                    agent_type="docker",
+                    depends_on=["container-0"] if i else []
+                )
+                for i in range(3)
+            ]
+            manager.record_deployments(resources)
+            
+            assert len(manager.get_all_resources()) == 3
+            assert manager.get_resource_state("container-2")["name"] == "app-2"
+            assert len(manager.get_dependent_resources("container-0")) == 2
+
 
 class TestStateManagerCheckpoints:
     """Test checkpoint and restore functionality."""
@@ -152,6 +175,37 @@ class TestStateManagerCheckpoints:
             assert len(all_resources) == 1
             assert all_resources[0]["resource_id"] == "res-1"
     
+    def test_can_restore_delta_checkpoint(self):
+        """Test restoring a checkpoint stored as a delta against an earlier one."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = StateManager(storage_path=tmpdir)
+            
+            for i in (1, 2):
+                manager.record_deployment(ResourceState(
+                    resource_id=f"res-{i}",
+                    resource_type="docker_container",
+                    name=f"app-{i}",
+                    metadata={},
+                    agent_type="docker"
+                ))
+            base_id = manager.create_checkpoint("Base")
+            
+            manager.rollback_resources(["res-1"])
+            manager.record_deployment(ResourceState(
+                resource_id="res-3",
+                resource_type="docker_container",
+                name="app-3",
+                metadata={},
+                agent_type="docker"
+            ))
+            delta_id = manager.create_checkpoint("Delta", base=base_id)
+            
+            manager.restore_checkpoint(base_id)
+            assert manager.restore_checkpoint(delta_id) is True
+            
+            ids = {r["resource_id"] for r in manager.get_all_resources()}
+            assert ids == {"res-2", "res-3"}
+    
     def test_checkpoint_includes_metadata(self):
         """Test checkpoint stores description and timestamp."""
         with tempfile.TemporaryDirectory() as tmpdir: